@@ -0,0 +1,60 @@
+"""Console-script and `python -m busy_bridge` entry point.
+
+`--help` and `--version` are answered from static text before Click, Rich or
+the command table are imported; every other invocation goes through
+`busy_bridge.cli`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from . import __version__
+
+# Must match `busy-bridge --help` exactly; tests/test_cli.py fails on drift.
+_STATIC_HELP = """\
+Usage: busy-bridge [OPTIONS] COMMAND [ARGS]...
+
+  Busy Bridge - CLI gateway to Busy38's sophisticated agent capabilities.
+
+  Use Busy38's IDE, missions, and tool creation from the command line.
+
+Options:
+  --version          Show the version and exit.
+  -c, --config TEXT  Path to config file
+  --url TEXT         Busy38 API URL
+  --api-key TEXT     Busy38 API key
+  --json             Print raw JSON responses
+  --help             Show this message and exit.
+
+Commands:
+  cheatcode  Cheatcode operations.
+  daemon     Warm local daemon for fast repeated CLI calls.
+  health     Check Busy38 API health.
+  make       Shortcut: Create a new tool.
+  mission    Mission operations.
+  server     Start the API server.
+  settings   Settings import and configuration helpers.
+  start      Shortcut: Start a new mission.
+  tool       Tool operations.
+  use        Shortcut: Execute a tool via plain English.
+"""
+
+
+def main() -> None:
+    """Entry point for the CLI."""
+    argv = sys.argv[1:]
+    if argv == ["--help"]:
+        sys.stdout.write(_STATIC_HELP)
+        return
+    if argv == ["--version"]:
+        sys.stdout.write(f"busy-bridge, version {__version__}\n")
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,145 @@ busy-bridge server endpoints.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import importlib
+import operator
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+
+def _cached_import(module_path: str, attr: str) -> Any:
+    """Return ``attr`` from ``module_path``, consulting ``sys.modules`` first.
+
+    ``importlib.import_module`` takes the import lock even for modules that are
+    already loaded; the direct ``sys.modules`` peek skips that on warm paths.
+    """
+    modules = sys.modules
+    module = modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+    return getattr(module, attr)
+
+
+_USE_TOOL_PREFIX = "Use a tool to: "
+_MAKE_TOOL_PREFIX = "Create a tool that: "
+
+_NOTE_FIELDS = operator.attrgetter("category", "title", "author_id")
+_STEP_KEYS = ("index", "description", "status", "output")
+_STEP_FIELDS = operator.attrgetter(*_STEP_KEYS)
+_STATE_VALUE = operator.attrgetter("value")
+
+_BUSY_PROBE_RELPATH = os.path.join("core", "orchestration", "integration.py")
+# (cwd, BUSY38_SOURCE_PATH) -> located checkout. Only hits are remembered: a
+# checkout created or fixed after a failed lookup must still be found by a
+# long-running server or daemon.
+_busy_source_hits: Dict[Tuple[str, str], str] = {}
+
+
+def _resolve_busy_source_path_cached(cwd: str, raw_env: str) -> Optional[str]:
+    """Locate the Busy checkout for a given (cwd, BUSY38_SOURCE_PATH) pair.
+
+    Keyed on both inputs so changing either one re-probes the filesystem; a
+    found checkout is probed once per process rather than once per adapter,
+    and a miss is probed again on the next call.
+    """
+    key = (cwd, raw_env)
+    hit = _busy_source_hits.get(key)
+    if hit is not None:
+        return hit
+
+    candidates: List[Path] = []
+
+    if raw_env:
+        candidates.append(Path(raw_env))
+
+    here = Path(__file__).resolve()
+    project_root = here.parent.parent
+    workspace = project_root.parent
+    candidates.extend(
+        [
+            Path(cwd),
+            project_root,
+            workspace / "busy-38-ongoing",
+            workspace / "Busy38",
+            workspace / "Busy",
+            workspace / "busy-src",
+        ]
+    )
+
+    # Dedupe on the raw spelling first so repeated candidates (e.g. cwd ==
+    # project_root) skip resolve(), which costs a syscall per path component.
+    raw_seen = set()
+    seen = set()
+    for candidate in candidates:
+        raw = str(candidate)
+        if raw in raw_seen:
+            continue
+        raw_seen.add(raw)
+        resolved = str(candidate.expanduser().resolve())
+        if resolved in seen:
+            continue
+        seen.add(resolved)
+        if os.path.isfile(os.path.join(resolved, _BUSY_PROBE_RELPATH)):
+            _busy_source_hits[key] = resolved
+            return resolved
+    return None
+
+
+def _copy_mission_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    # Payloads stay in _serialize_cache across calls, and their lists alias
+    # Busy's own spec lists, so every container a caller could mutate is copied.
+    out = dict(payload)
+    out["steps"] = [dict(step) for step in payload["steps"]]
+    for key in ("acceptance_criteria", "allowed_namespaces"):
+        value = payload[key]
+        if isinstance(value, list):
+            out[key] = list(value)
+    return out
+
+
+def _needs_init(method: Callable[..., Any]) -> Callable[..., Any]:
+    # Abstraction justification: one guard shared by every public coroutine so
+    # a newly added endpoint cannot forget to initialize Busy before touching
+    # the orchestrator. It only gates on the init flag; no authority decisions.
+    @functools.wraps(method)
+    async def wrapper(self: Busy38Adapter, *args: Any, **kwargs: Any) -> Any:
+        if not self._initialized:
+            await self.initialize()
+        return await method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Busy38Adapter:
     """Adapter that wraps Busy38 internals."""
 
+    # Refactor hazard: new instance attributes must be listed here or
+    # __init__ raises AttributeError.
+    __slots__ = (
+        "orchestrator",
+        "tool_manager",
+        "_busy_src_path",
+        "_Busy38Orchestrator",
+        "_OrchestratorConfig",
+        "_MissionSpec",
+        "_ToolManager",
+        "_cheatcode_registry",
+        "_exec_cheatcode",
+        "_cheatcode_lock",
+        "_serialize_cache",
+        "_mission_version",
+        "_get_notes",
+        "_post_note",
+        "_state_type",
+        "_state_to_str",
+        "_initialized",
+    )
+
     def __init__(self):
         self.orchestrator: Optional[Any] = None
         self.tool_manager: Optional[Any] = None
@@ -27,40 +155,28 @@ class Busy38Adapter:
         self._MissionSpec: Optional[Type[Any]] = None
         self._ToolManager: Optional[Type[Any]] = None
         self._cheatcode_registry: Optional[Any] = None
+        self._exec_cheatcode: Optional[Callable[[str, str, Dict[str, Any]], Any]] = None
+        # Busy's cheatcode registry and its handlers make no thread-safety
+        # promise; they were only ever called one at a time from the loop.
+        self._cheatcode_lock = asyncio.Lock()
+        # mission_id -> (fingerprint, version, serialized payload); one entry per mission.
+        self._serialize_cache: Dict[str, Tuple[Tuple[Any, ...], int, Dict[str, Any]]] = {}
+        # Bumped whenever any mission payload is rebuilt; see list_missions().
+        self._mission_version = 0
+        # Bound once per orchestrator start; None means this Busy build lacks the API.
+        self._get_notes: Optional[Callable[[str], Any]] = None
+        self._post_note: Optional[Callable[..., Any]] = None
+        # Mission state serializer specialized on the first state type seen.
+        self._state_type: Optional[type] = None
+        self._state_to_str: Callable[[Any], Any] = str
 
         self._initialized = False
 
     def _resolve_busy_source_path(self) -> Optional[Path]:
-        candidates: List[Path] = []
-
-        raw_env = os.getenv("BUSY38_SOURCE_PATH", "").strip()
-        if raw_env:
-            candidates.append(Path(raw_env))
-
-        here = Path(__file__).resolve()
-        project_root = here.parent.parent
-        workspace = project_root.parent
-        candidates.extend(
-            [
-                Path.cwd(),
-                project_root,
-                workspace / "busy-38-ongoing",
-                workspace / "Busy38",
-                workspace / "Busy",
-                workspace / "busy-src",
-            ]
+        resolved = _resolve_busy_source_path_cached(
+            str(Path.cwd()), os.getenv("BUSY38_SOURCE_PATH", "").strip()
         )
-
-        seen = set()
-        for candidate in candidates:
-            p = candidate.expanduser().resolve()
-            key = str(p)
-            if key in seen:
-                continue
-            seen.add(key)
-            if (p / "core" / "orchestration" / "integration.py").exists():
-                return p
-        return None
+        return Path(resolved) if resolved is not None else None
 
     def _ensure_busy_imports(self) -> None:
         if self._Busy38Orchestrator is not None:
@@ -72,19 +188,29 @@ class Busy38Adapter:
                 "Could not locate Busy source path. Set BUSY38_SOURCE_PATH to your Busy checkout."
             )
         self._busy_src_path = src
+        # On sys.path rather than a scoped import hook: Busy code that reads
+        # sys.path or starts Python subprocesses must see the checkout too.
         if str(src) not in sys.path:
             sys.path.insert(0, str(src))
 
-        integration_mod = importlib.import_module("core.orchestration.integration")
-        registry_mod = importlib.import_module("core.cheatcodes.registry")
-        mission_mod = importlib.import_module("core.mission")
-        tools_mod = importlib.import_module("core.tools.manager")
-
-        self._Busy38Orchestrator = getattr(integration_mod, "Busy38Orchestrator")
-        self._OrchestratorConfig = getattr(integration_mod, "OrchestratorConfig")
-        self._cheatcode_registry = getattr(registry_mod, "cheatcode_registry")
-        self._MissionSpec = getattr(mission_mod, "MissionSpec")
-        self._ToolManager = getattr(tools_mod, "ToolManager")
+        self._Busy38Orchestrator = _cached_import(
+            "core.orchestration.integration", "Busy38Orchestrator"
+        )
+        self._OrchestratorConfig = _cached_import(
+            "core.orchestration.integration", "OrchestratorConfig"
+        )
+        self._cheatcode_registry = _cached_import("core.cheatcodes.registry", "cheatcode_registry")
+        self._MissionSpec = _cached_import("core.mission", "MissionSpec")
+        self._ToolManager = _cached_import("core.tools.manager", "ToolManager")
+
+    def _bind_notes_api(self, notes: Any) -> None:
+        # The notes manager's shape is fixed for a given Busy build, so resolve
+        # the supported methods once instead of probing with hasattr per call.
+        get_notes = getattr(notes, "get_mission_notes", None)
+        if get_notes is None:
+            get_notes = getattr(notes, "get_notes_for_context", None)
+        self._get_notes = get_notes
+        self._post_note = getattr(notes, "post_structured_note", None)
 
     async def initialize(self):
         """Initialize Busy38 components."""
@@ -92,16 +218,22 @@ class Busy38Adapter:
             return
 
         self._ensure_busy_imports()
+        self._exec_cheatcode = self._cheatcode_registry.execute
 
         config = self._OrchestratorConfig()
         self.orchestrator = self._Busy38Orchestrator(config)
         await self.orchestrator.start()
+        self._bind_notes_api(self.orchestrator.missions.notes)
 
         tools_dir = None
         if self._busy_src_path is not None:
             tools_dir = self._busy_src_path / "capabilities" / "tools"
-        self.tool_manager = self._ToolManager(tools_dir=str(tools_dir) if tools_dir else "capabilities/tools")
-        self.tool_manager.load_all()
+        self.tool_manager = self._ToolManager(
+            tools_dir=str(tools_dir) if tools_dir else "capabilities/tools"
+        )
+        # load_all walks capabilities/tools and parses YAML; keep that filesystem
+        # work off the event loop so concurrent requests are not stalled.
+        await asyncio.to_thread(self.tool_manager.load_all)
 
         self._initialized = True
 
@@ -111,43 +243,45 @@ class Busy38Adapter:
             await self.orchestrator.stop()
         self._initialized = False
 
+    @_needs_init
     async def list_tools(self) -> List[Dict[str, Any]]:
         """List available tools."""
-        await self.initialize()
-        tools = []
-        for _, spec in self.tool_manager._tools.items():
-            tools.append(
-                {
-                    "name": spec.get("name", ""),
-                    "description": spec.get("description", ""),
-                    "category": "general",
-                }
-            )
-        return tools
-
+        # Built fresh on every call: Busy's registry gives no change signal
+        # (tool-builder missions register into it later, and specs can be
+        # replaced in place), so a cached copy could not be invalidated
+        # reliably. The server's /tools body cache absorbs repeated polls.
+        return [
+            {
+                "name": spec.get("name", ""),
+                "description": spec.get("description", ""),
+                "category": "general",
+            }
+            for spec in self.tool_manager._tools.values()
+        ]
+
+    @_needs_init
     async def lookup_tool(self, name: str) -> Dict[str, Any]:
         """Get tool details."""
-        await self.initialize()
         spec = self.tool_manager._tools.get(name)
         if not spec:
             raise ValueError(f"Tool not found: {name}")
         return spec
 
+    @_needs_init
     async def use_tool(self, description: str) -> Dict[str, Any]:
         """Execute a tool via plain English description."""
-        await self.initialize()
-        result = await self.orchestrator.run_agent_loop(f"Use a tool to: {description}")
+        result = await self.orchestrator.run_agent_loop(_USE_TOOL_PREFIX + description)
         return {
             "success": True,
             "result": result,
             "tool_used": "inferred_from_description",
         }
 
+    @_needs_init
     async def make_tool(self, description: str) -> str:
         """Create a new tool via mission and return mission id."""
-        await self.initialize()
         spec = self._MissionSpec(
-            objective=f"Create a tool that: {description}",
+            objective=_MAKE_TOOL_PREFIX + description,
             role="tool_builder_agent",
             acceptance_criteria=[
                 "YAML spec created in capabilities/tools/",
@@ -159,20 +293,69 @@ class Busy38Adapter:
         run = self.orchestrator.missions.start_mission(spec)
         return run.spec.mission_id
 
-    async def list_missions(self) -> List[Dict[str, Any]]:
-        """List all missions."""
-        await self.initialize()
+    @property
+    def mission_version(self) -> int:
+        """Version stamp of the most recently changed mission payload."""
+        return self._mission_version
+
+    @_needs_init
+    async def list_missions(self, since_version: int = 0) -> List[Dict[str, Any]]:
+        """List missions changed after ``since_version`` (all missions for 0).
+
+        Pollers pass back the ``mission_version`` seen on their previous call to
+        receive only runs whose payload changed since then. Runs removed from
+        Busy are not reported by an incremental listing.
+        """
+        return [
+            _copy_mission_payload(payload)
+            for _, payload in self._changed_mission_entries(since_version)
+        ]
+
+    @_needs_init
+    async def list_missions_page(
+        self, since_version: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return at most ``limit`` changed missions and the cursor to poll with next.
+
+        Missions come out oldest change first, so when the page is cut short the
+        cursor is the version of its last mission and the next call resumes
+        right after it; otherwise the cursor is ``mission_version``.
+        """
+        entries = self._changed_mission_entries(since_version)
+        cursor = self._mission_version
+        if limit is not None and len(entries) > limit:
+            entries.sort(key=lambda item: item[0])
+            del entries[limit:]
+            cursor = entries[-1][0] if entries else since_version
+        return [_copy_mission_payload(payload) for _, payload in entries], cursor
+
+    def _changed_mission_entries(self, since_version: int) -> List[Tuple[int, Dict[str, Any]]]:
         runs = self.orchestrator.missions.list_runs()
-        return [self._serialize_mission_run(run) for run in runs]
+        entry = self._mission_entry
+        out: List[Tuple[int, Dict[str, Any]]] = []
+        for run in runs:
+            version, payload = entry(run)
+            if version > since_version:
+                out.append((version, payload))
+        # Every listed run now has a cache entry, so a larger cache means Busy
+        # has dropped runs since they were cached. Pruning them keeps the cache
+        # bounded by the live mission set for the life of the server.
+        cache = self._serialize_cache
+        if len(cache) > len(runs):
+            live = {run.spec.mission_id for run in runs}
+            for mission_id in [m for m in cache if m not in live]:
+                del cache[mission_id]
+        return out
 
+    @_needs_init
     async def get_mission(self, mission_id: str) -> Dict[str, Any]:
         """Get mission details."""
-        await self.initialize()
         run = self.orchestrator.missions.get_run(mission_id)
         if not run:
             raise ValueError(f"Mission not found: {mission_id}")
         return self._serialize_mission_run(run)
 
+    @_needs_init
     async def start_mission(
         self,
         objective: str,
@@ -182,7 +365,6 @@ class Busy38Adapter:
         max_steps: int = 6,
     ) -> str:
         """Start a new mission and return mission id."""
-        await self.initialize()
         spec = self._MissionSpec(
             objective=objective,
             role=role,
@@ -193,23 +375,24 @@ class Busy38Adapter:
         run = self.orchestrator.missions.start_mission(spec)
         return run.spec.mission_id
 
+    @_needs_init
     async def cancel_mission(self, mission_id: str, reason: str) -> bool:
         """Cancel a mission."""
-        await self.initialize()
+        self._serialize_cache.pop(mission_id, None)
         return self.orchestrator.missions.cancel_mission(
             mission_id, reason=reason, cancelled_by="busy-bridge"
         )
 
+    @_needs_init
     async def respond_to_mission(self, mission_id: str, response: str) -> bool:
         """Respond to a mission query via Busy notes API."""
-        await self.initialize()
         run = self.orchestrator.missions.get_run(mission_id)
         if not run:
             raise ValueError(f"Mission not found: {mission_id}")
 
-        notes = self.orchestrator.missions.notes
-        if hasattr(notes, "post_structured_note"):
-            notes.post_structured_note(
+        post_note = self._post_note
+        if post_note is not None:
+            post_note(
                 recipient_id=mission_id,
                 author_id="busy-bridge",
                 author_role="bridge_orchestrator",
@@ -222,73 +405,128 @@ class Busy38Adapter:
 
         raise RuntimeError("Busy notes API does not support structured mission responses")
 
+    @_needs_init
     async def get_mission_notes(self, mission_id: str) -> List[Dict[str, Any]]:
         """Get notes for a mission."""
-        await self.initialize()
-        notes_mgr = self.orchestrator.missions.notes
-        if hasattr(notes_mgr, "get_mission_notes"):
-            notes = notes_mgr.get_mission_notes(mission_id)
-        elif hasattr(notes_mgr, "get_notes_for_context"):
-            notes = notes_mgr.get_notes_for_context(mission_id)
-        else:
-            notes = []
-
+        get_notes = self._get_notes
+        notes = get_notes(mission_id) if get_notes is not None else []
+
+        note_fields = _NOTE_FIELDS
+        # Timestamp for notes without created_at: taken once per response, on
+        # first need, rather than per note. Naive UTC, the same shape the
+        # deprecated datetime.utcnow() produced.
+        fallback_ts: Optional[str] = None
         out: List[Dict[str, Any]] = []
         for note in notes:
+            try:
+                category, title, author_id = note_fields(note)
+            except AttributeError:
+                # Older Busy note records may omit fields; keep the per-field defaults.
+                category = getattr(note, "category", "unknown")
+                title = getattr(note, "title", "")
+                author_id = getattr(note, "author_id", "")
             payload = (getattr(note, "metadata", {}) or {}).get("payload", {})
-            ts = (
-                note.created_at.isoformat()
-                if hasattr(note, "created_at") and note.created_at is not None
-                else datetime.utcnow().isoformat()
-            )
+            created_at = getattr(note, "created_at", None)
+            if created_at is not None:
+                ts = created_at.isoformat()
+            else:
+                if fallback_ts is None:
+                    fallback_ts = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+                ts = fallback_ts
             out.append(
                 {
-                    "category": getattr(note, "category", "unknown"),
-                    "title": getattr(note, "title", ""),
-                    "author_id": getattr(note, "author_id", ""),
+                    "category": category,
+                    "title": title,
+                    "author_id": author_id,
                     "payload": payload,
                     "timestamp": ts,
                 }
             )
         return out
 
+    @_needs_init
     async def execute_cheatcode(
         self, namespace: str, action: str, attributes: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute a cheatcode."""
-        await self.initialize()
+        # Cheatcodes are synchronous and do real file and subprocess work
+        # (rw4:read_file, rw4:shell); running them in a worker thread keeps a
+        # slow one from stalling every other request on the event loop. The
+        # lock keeps them one at a time, as they were on the loop, since the
+        # registry is not known to be safe to call from several threads.
+        execute = self._exec_cheatcode
         try:
-            result = self._cheatcode_registry.execute(namespace, action, attributes)
+            async with self._cheatcode_lock:
+                result = await asyncio.to_thread(execute, namespace, action, attributes)
             return {"success": True, "result": result}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _mission_run_fingerprint(self, run) -> Tuple[Any, ...]:
+        # Invariant: every run field that can change after creation must be
+        # reflected here, otherwise list_missions serves a stale payload.
+        # Comparing unchanged outputs is cheap: tuple equality short-circuits
+        # on identity before comparing string contents.
+        return (
+            run.state,
+            run.started_at,
+            run.completed_at,
+            run.final_output,
+            run.error,
+            run.cancel_reason,
+            run.cancelled_by,
+            tuple((step.status, step.output) for step in run.steps),
+        )
+
+    def _mission_entry(self, run) -> Tuple[int, Dict[str, Any]]:
+        """Return (version, payload) for a run, rebuilding only if it changed."""
+        mission_id = run.spec.mission_id
+        fingerprint = self._mission_run_fingerprint(run)
+        cached = self._serialize_cache.get(mission_id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1], cached[2]
+        payload = self._build_mission_run_payload(run)
+        self._mission_version += 1
+        version = self._mission_version
+        self._serialize_cache[mission_id] = (fingerprint, version, payload)
+        return version, payload
+
     def _serialize_mission_run(self, run) -> Dict[str, Any]:
-        """Convert MissionRunRecord to dict."""
+        """Convert MissionRunRecord to dict, reusing the last payload if unchanged."""
+        return _copy_mission_payload(self._mission_entry(run)[1])
+
+    def _specialize_state(self, state: Any) -> None:
+        # Busy's state type is fixed per build, so the enum-vs-plain check runs
+        # once per type; the type guard at the call site re-specializes on drift.
+        self._state_type = type(state)
+        self._state_to_str = _STATE_VALUE if hasattr(state, "value") else str
+
+    def _build_mission_run_payload(self, run) -> Dict[str, Any]:
+        spec = run.spec
+        state = run.state
+        if type(state) is not self._state_type:
+            self._specialize_state(state)
+        step_fields = _STEP_FIELDS
+        created_at = run.created_at
+        started_at = run.started_at
+        completed_at = run.completed_at
         return {
-            "mission_id": run.spec.mission_id,
-            "objective": run.spec.objective,
-            "role": run.spec.role,
-            "state": run.state.value if hasattr(run.state, "value") else str(run.state),
-            "acceptance_criteria": run.spec.acceptance_criteria,
-            "allowed_namespaces": run.spec.allowed_namespaces,
-            "max_steps": run.spec.max_steps,
-            "created_at": run.created_at.isoformat()
-            if hasattr(run.created_at, "isoformat")
-            else str(run.created_at),
-            "started_at": run.started_at.isoformat() if run.started_at else None,
-            "completed_at": run.completed_at.isoformat() if run.completed_at else None,
+            "mission_id": spec.mission_id,
+            "objective": spec.objective,
+            "role": spec.role,
+            "state": self._state_to_str(state),
+            "acceptance_criteria": spec.acceptance_criteria,
+            "allowed_namespaces": spec.allowed_namespaces,
+            "max_steps": spec.max_steps,
+            # created_at is not guaranteed to be a datetime across Busy versions.
+            "created_at": (
+                created_at.isoformat() if hasattr(created_at, "isoformat") else str(created_at)
+            ),
+            "started_at": started_at.isoformat() if started_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
             "final_output": run.final_output,
             "error": run.error,
-            "steps": [
-                {
-                    "index": step.index,
-                    "description": step.description,
-                    "status": step.status,
-                    "output": step.output,
-                }
-                for step in run.steps
-            ],
+            "steps": [dict(zip(_STEP_KEYS, step_fields(step))) for step in run.steps],
             "cancel_reason": run.cancel_reason,
             "cancelled_by": run.cancelled_by,
         }
@@ -296,14 +534,20 @@ class Busy38Adapter:
 
 # Global adapter instance
 _adapter: Optional[Busy38Adapter] = None
+# Serializes first-time construction: without it, concurrent first requests can
+# each see `_adapter is None` and start separate Busy38 orchestrators.
+_adapter_lock = asyncio.Lock()
 
 
 async def get_adapter() -> Busy38Adapter:
     """Get or create the global adapter instance."""
     global _adapter
     if _adapter is None:
-        _adapter = Busy38Adapter()
-        await _adapter.initialize()
+        async with _adapter_lock:
+            if _adapter is None:
+                adapter = Busy38Adapter()
+                await adapter.initialize()
+                _adapter = adapter
     return _adapter
 
 
@@ -0,0 +1 @@
+"""Busy Bridge CLI subcommands, imported on demand by ``busy_bridge.cli.LazyGroup``."""
@@ -0,0 +1,53 @@
+"""`busy-bridge cheatcode` command group."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Tuple
+
+import click
+
+from ..cli import _emit, _maybe_status, console, pass_client
+
+if TYPE_CHECKING:
+    from ..client import Busy38Client
+
+
+@click.group()
+def cheatcode() -> None:
+    """Cheatcode operations."""
+    pass
+
+
+@cheatcode.command("use")
+@click.argument("cheatcode_str")
+@click.option("--param", "-p", multiple=True, help="Parameters as key=value")
+@pass_client
+def use_cheatcode(client: Busy38Client, cheatcode_str: str, param: Tuple[str, ...]) -> None:
+    """Execute a cheatcode.
+
+    Format: namespace:action
+
+    Example: busy-bridge cheatcode use rw4:read_file --param path=README.md
+    """
+    from ..formatters import format_cheatcode_result
+
+    # Parse cheatcode string
+    namespace, sep, action = cheatcode_str.partition(":")
+    if not sep:
+        console.print("[red]Error:[/red] Cheatcode must be in format namespace:action")
+        sys.exit(1)
+
+    # Parse parameters
+    attributes = {}
+    for p in param:
+        key, sep, value = p.partition("=")
+        if not sep:
+            console.print(f"[red]Error:[/red] Parameter must be key=value: {p}")
+            sys.exit(1)
+        attributes[key] = value
+
+    with _maybe_status(f"[bold green]Executing {namespace}:{action}..."):
+        result = client.use_cheatcode(namespace, action, **attributes)
+
+    _emit(result, format_cheatcode_result)
@@ -0,0 +1,80 @@
+"""`busy-bridge daemon` command group."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import NoReturn
+
+import click
+
+from ..cli import _emit, _reject_json, console
+
+
+@click.group()
+def daemon() -> None:
+    """Warm local daemon for fast repeated CLI calls."""
+    pass
+
+
+@daemon.command("start")
+def daemon_start() -> None:
+    """Run the daemon in the foreground until `daemon stop`.
+
+    While it runs, `busy-bridge-fast ARGS...` executes commands through it.
+    """
+    from ..daemon import DaemonError, serve, socket_path
+
+    _reject_json("by `daemon start`")
+    console.print(f"[green]Busy Bridge daemon listening on {socket_path()}[/green]")
+    try:
+        serve()
+    except DaemonError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Daemon stopped[/yellow]")
+
+
+@daemon.command("stop")
+def daemon_stop() -> None:
+    """Stop a running daemon."""
+    from ..daemon import DaemonError, send_control, socket_path
+
+    try:
+        reply = send_control("stop")
+    except DaemonError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    if reply is None:
+        _not_running(socket_path())
+    _emit(
+        {"stopped": True, "socket": str(socket_path())},
+        lambda r: console.print("[green]✓[/green] Daemon stopped"),
+    )
+
+
+@daemon.command("status")
+def daemon_status() -> None:
+    """Report whether a daemon is running."""
+    from ..daemon import DaemonError, send_control, socket_path
+
+    try:
+        reply = send_control("ping")
+    except DaemonError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    if reply is None:
+        _not_running(socket_path())
+    _emit(
+        {"running": True, "pid": reply.get("pid"), "socket": str(socket_path())},
+        lambda r: console.print(f"[green]Daemon running[/green] (pid {r['pid']}, {r['socket']})"),
+    )
+
+
+def _not_running(path: Path) -> NoReturn:
+    _emit(
+        {"running": False, "socket": str(path)},
+        lambda r: console.print(f"[yellow]No daemon listening on {r['socket']}[/yellow]"),
+    )
+    sys.exit(1)
@@ -0,0 +1,22 @@
+"""`busy-bridge health` command."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from ..cli import _emit, pass_client
+
+if TYPE_CHECKING:
+    from ..client import Busy38Client
+
+
+@click.command()
+@pass_client
+def health(client: Busy38Client) -> None:
+    """Check Busy38 API health."""
+    from ..formatters import format_health
+
+    status = client.health()
+    _emit(status, format_health)
@@ -0,0 +1,129 @@
+"""`busy-bridge mission` command group."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+
+import click
+
+from ..cli import (
+    _emit,
+    _follow_mission_progress,
+    _json_output,
+    _maybe_status,
+    _reject_json,
+    console,
+    pass_client,
+)
+
+if TYPE_CHECKING:
+    from ..client import Busy38Client
+
+
+@click.group()
+def mission() -> None:
+    """Mission operations."""
+    pass
+
+
+def _start_mission(
+    client: Busy38Client, objective: str, role: str, max_steps: int, follow: bool
+) -> None:
+    if follow:
+        _reject_json("with --follow")
+    with _maybe_status("[bold green]Starting mission..."):
+        result = client.start_mission(
+            objective=objective,
+            role=role,
+            max_steps=max_steps,
+        )
+
+    mission_id = result.get("mission_id")
+    _emit(result, lambda r: console.print(f"[green]✓[/green] Mission started: {mission_id}"))
+
+    if follow:
+        console.print("\n[dim]Following mission progress...[/dim]")
+        if mission_id:
+            _follow_mission_progress(client, mission_id)
+        else:
+            console.print(
+                "[yellow]No mission id returned; use 'show mission' to check status[/yellow]"
+            )
+
+
+@mission.command("start")
+@click.argument("objective")
+@click.option("--role", "-r", default="mission_agent", help="Agent role")
+@click.option("--max-steps", "-s", default=6, help="Maximum steps")
+@click.option("--follow", "-f", is_flag=True, help="Follow mission progress")
+@pass_client
+def start_mission(
+    client: Busy38Client, objective: str, role: str, max_steps: int, follow: bool
+) -> None:
+    """Start a new mission.
+
+    Example: busy-bridge mission start "Analyze codebase for security issues"
+    """
+    _start_mission(client, objective, role, max_steps, follow)
+
+
+@mission.command("list")
+@pass_client
+def list_missions(client: Busy38Client) -> None:
+    """List all missions."""
+    from ..formatters import format_mission_list
+
+    missions = client.list_missions()
+    _emit(missions, format_mission_list)
+
+
+@mission.command("show")
+@click.argument("mission_id")
+@click.option("--notes", "-n", is_flag=True, help="Include notes")
+@pass_client
+def show_mission(client: Busy38Client, mission_id: str, notes: bool) -> None:
+    """Show mission details."""
+    from ..formatters import format_json, format_mission_details
+
+    mission = client.get_mission(mission_id)
+    notes_list = None
+    if notes:
+        notes_list = client.get_mission_notes(mission_id)
+    if _json_output():
+        format_json({"mission": mission, "notes": notes_list} if notes else mission)
+    else:
+        format_mission_details(mission, notes_list)
+
+
+@mission.command("cancel")
+@click.argument("mission_id")
+@click.option("--reason", "-r", default="Cancelled by user", help="Cancellation reason")
+@pass_client
+def cancel_mission(client: Busy38Client, mission_id: str, reason: str) -> None:
+    """Cancel a running mission."""
+    result = client.cancel_mission(mission_id, reason)
+
+    def render(result: Dict[str, Any]) -> None:
+        if result.get("success"):
+            console.print(f"[green]✓[/green] Mission {mission_id} cancelled")
+        else:
+            console.print(f"[red]✗[/red] Failed to cancel: {result.get('error', 'Unknown error')}")
+
+    _emit(result, render)
+
+
+@mission.command("respond")
+@click.argument("mission_id")
+@click.argument("response")
+@pass_client
+def respond_to_mission(client: Busy38Client, mission_id: str, response: str) -> None:
+    """Respond to a mission query."""
+    result = client.respond_to_mission(mission_id, response)
+
+    def render(result: Dict[str, Any]) -> None:
+        if result.get("success"):
+            console.print(f"[green]✓[/green] Response sent to mission {mission_id}")
+        else:
+            console.print(f"[red]✗[/red] Failed to respond: {result.get('error', 'Unknown error')}")
+
+    _emit(result, render)
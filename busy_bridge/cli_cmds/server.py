@@ -0,0 +1,31 @@
+"""`busy-bridge server` command.
+
+The server stack comes from the `server` extra. It is imported here, at module
+load, so a missing extra surfaces when `LazyGroup` looks the command up rather
+than after the command has started.
+"""
+
+from __future__ import annotations
+
+import click
+import uvicorn  # noqa: F401  (used by start_server; imported here to fail early)
+
+from ..cli import _reject_json, console
+from ..server import start_server
+
+
+@click.command()
+@click.option("--host", "-h", default="0.0.0.0", help="Host to bind to")
+@click.option("--port", "-p", default=8080, help="Port to listen on")
+def server(host: str, port: int) -> None:
+    """Start the API server.
+
+    Runs the Busy Bridge API server that OpenClaw agents connect to.
+    """
+    _reject_json("by `server`")
+    console.print(f"[green]Starting Busy Bridge API server on {host}:{port}[/green]")
+
+    try:
+        start_server(host=host, port=port)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Server stopped[/yellow]")
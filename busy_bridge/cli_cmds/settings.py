@@ -0,0 +1,196 @@
+"""`busy-bridge settings` command group."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import click
+
+from ..cli import _emit, _json_output, console
+
+if TYPE_CHECKING:
+    from ..client import Busy38Client
+
+
+@click.group()
+def settings() -> None:
+    """Settings import and configuration helpers."""
+    pass
+
+
+@settings.command("show")
+@click.pass_context
+def settings_show(ctx: click.Context) -> None:
+    """Show active Busy Bridge settings."""
+    client: Busy38Client = ctx.obj
+    cfg = client.config
+    # `cli` always stores the resolved path; ctx.meta is shared down the chain.
+    cfg_path = ctx.meta["config_path"]
+    # api_key is deliberately left out of both renderings.
+    shown = {
+        "config_path": str(cfg_path),
+        "url": cfg.url,
+        "agent_id": cfg.agent_id,
+        "timeout": cfg.timeout,
+        "model_settings": cfg.model_settings or {},
+        "imported_from": cfg.imported_from,
+        "imported_at": cfg.imported_at,
+    }
+
+    def render(shown: Dict[str, Any]) -> None:
+        lines = [
+            f"[bold]Config file:[/bold] {shown['config_path']}",
+            f"[bold]Busy URL:[/bold] {shown['url']}",
+            f"[bold]Agent ID:[/bold] {shown['agent_id']}",
+            f"[bold]Timeout:[/bold] {shown['timeout']}",
+            f"[bold]Model settings:[/bold] {shown['model_settings']}",
+        ]
+        if shown["imported_from"]:
+            lines.append(f"[bold]Imported from:[/bold] {shown['imported_from']}")
+        if shown["imported_at"]:
+            lines.append(f"[bold]Imported at:[/bold] {shown['imported_at']}")
+        console.print("\n".join(lines))
+
+    _emit(shown, render)
+
+
+@settings.command("detect")
+@click.option("--source", help="Specific source system (e.g. openclaw)")
+def settings_detect(source: Optional[str]) -> None:
+    """Detect importable model settings from installed agent systems."""
+    from ..import_settings import detect_installed_system_configs
+
+    found = detect_installed_system_configs(source=source)
+    # Secret values never leave the detection; only their count is reported.
+    hits = [
+        {
+            "system": hit.system,
+            "config_path": str(hit.config_path),
+            "model_settings": hit.model_settings or {},
+            "agent_settings": hit.agent_settings or {},
+            "plaintext_secrets": len(hit.secrets),
+        }
+        for hit in found
+    ]
+
+    def render(hits: List[Dict[str, Any]]) -> None:
+        if not hits:
+            console.print("[yellow]No importable agent-system model settings detected.[/yellow]")
+            return
+        lines = [f"[green]Detected {len(hits)} import candidate(s):[/green]"]
+        for hit in hits:
+            lines.append(f"- [bold]{hit['system']}[/bold] ({hit['config_path']})")
+            lines.append(f"  model settings: {hit['model_settings']}")
+            lines.append(f"  agent settings: {hit['agent_settings']}")
+            lines.append(f"  plaintext secrets detected: {hit['plaintext_secrets']}")
+        console.print("\n".join(lines))
+
+    _emit(hits, render)
+
+
+@settings.command("import")
+@click.option("--source", help="Specific source system to import from (e.g. openclaw)")
+@click.option("--dry-run", is_flag=True, help="Preview import without writing config")
+@click.option(
+    "--to-squidstore", is_flag=True, help="Also import detected settings/secrets into Squid store"
+)
+@click.option("--squidstore-db", type=str, help="Squid store DB path override")
+@click.option("--target-agent-id", default="busy-bridge", help="Target agent_id in Squid store")
+@click.pass_context
+def settings_import(
+    ctx: click.Context,
+    source: Optional[str],
+    dry_run: bool,
+    to_squidstore: bool,
+    squidstore_db: Optional[str],
+    target_agent_id: str,
+) -> None:
+    """Import detected model settings into Busy Bridge config."""
+    from ..formatters import format_json
+    from ..import_settings import detect_installed_system_configs, import_detection_to_squid_store
+
+    client: Busy38Client = ctx.obj
+    # Under --json the steps below print nothing and one report is written at
+    # the end (or not at all if a write raises).
+    json_mode = _json_output()
+    report: Dict[str, Any] = {
+        "source": None,
+        "config_path": None,
+        "model_settings": None,
+        "dry_run": dry_run,
+        "saved_to": None,
+        "squidstore": None,
+    }
+
+    found = detect_installed_system_configs(source=source)
+    if not found:
+        if json_mode:
+            format_json(report)
+        else:
+            console.print("[yellow]No importable settings found.[/yellow]")
+        return
+
+    selected = found[0]
+    cfg = client.config
+    preview = dict(cfg.model_settings or {})
+    preview.update(selected.model_settings)
+    report.update(
+        source=selected.system,
+        config_path=str(selected.config_path),
+        model_settings=preview,
+    )
+
+    if not json_mode:
+        lines = [
+            f"[green]Import source:[/green] {selected.system} ({selected.config_path})",
+            f"[green]Merged model settings:[/green] {preview}",
+        ]
+        if dry_run:
+            lines.append("[cyan]Dry run only; no file written.[/cyan]")
+            if to_squidstore:
+                lines.append("[cyan]Dry run only; no Squid store writes.[/cyan]")
+        console.print("\n".join(lines))
+    if dry_run:
+        if json_mode:
+            format_json(report)
+        return
+
+    cfg.apply_model_import(selected.system, selected.model_settings)
+    written = cfg.save(ctx.meta["config_path"])
+    report["saved_to"] = str(written)
+    if not json_mode:
+        console.print(f"[green]✓ Imported settings saved to {written}[/green]")
+    if not to_squidstore:
+        if json_mode:
+            format_json(report)
+        return
+
+    result = import_detection_to_squid_store(
+        selected,
+        target_agent_id=target_agent_id,
+        db_path=Path(squidstore_db) if squidstore_db else None,
+        import_secrets=True,
+        import_settings=True,
+    )
+    report["squidstore"] = {
+        "success": result.success,
+        "db_path": str(result.db_path),
+        "imported_settings_count": result.imported_settings_count,
+        "imported_secret_count": result.imported_secret_count,
+        "errors": list(result.errors),
+    }
+
+    if json_mode:
+        format_json(report)
+    elif result.success:
+        console.print(
+            f"[green]✓ Squid store import complete ({result.db_path})[/green]\n"
+            f"- settings records: {result.imported_settings_count}\n"
+            f"- secret records: {result.imported_secret_count}"
+        )
+    else:
+        lines = [f"[yellow]Squid store import had errors ({result.db_path}):[/yellow]"]
+        for e in result.errors:
+            lines.append(f"- {e}")
+        console.print("\n".join(lines))
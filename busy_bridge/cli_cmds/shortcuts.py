@@ -0,0 +1,51 @@
+"""Top-level shortcuts: `use`, `start` and `make`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from ..cli import pass_client
+from .mission import _start_mission
+from .tool import _make_tool, _use_tool
+
+if TYPE_CHECKING:
+    from ..client import Busy38Client
+
+
+@click.command()
+@click.argument("description")
+@pass_client
+def use(client: Busy38Client, description: str) -> None:
+    """Shortcut: Execute a tool via plain English.
+
+    Same as: busy-bridge tool use "description"
+    """
+    _use_tool(client, description)
+
+
+@click.command()
+@click.argument("objective")
+@click.option("--role", "-r", default="mission_agent")
+@click.option("--max-steps", "-s", default=6)
+@click.option("--follow", "-f", is_flag=True)
+@pass_client
+def start(client: Busy38Client, objective: str, role: str, max_steps: int, follow: bool) -> None:
+    """Shortcut: Start a new mission.
+
+    Same as: busy-bridge mission start "objective"
+    """
+    _start_mission(client, objective, role, max_steps, follow)
+
+
+@click.command()
+@click.argument("description")
+@click.option("--follow", "-f", is_flag=True)
+@pass_client
+def make(client: Busy38Client, description: str, follow: bool) -> None:
+    """Shortcut: Create a new tool.
+
+    Same as: busy-bridge tool make "description"
+    """
+    _make_tool(client, description, follow)
@@ -0,0 +1,92 @@
+"""`busy-bridge tool` command group."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from ..cli import _emit, _follow_mission_progress, _maybe_status, _reject_json, console, pass_client
+
+if TYPE_CHECKING:
+    from ..client import Busy38Client
+
+
+@click.group()
+def tool() -> None:
+    """Tool operations."""
+    pass
+
+
+def _use_tool(client: Busy38Client, description: str) -> None:
+    from ..formatters import format_tool_result
+
+    with _maybe_status("[bold green]Executing tool..."):
+        result = client.use_tool(description)
+    _emit(result, format_tool_result)
+
+
+@tool.command("use")
+@click.argument("description")
+@pass_client
+def use_tool(client: Busy38Client, description: str) -> None:
+    """Execute a tool via plain English description.
+
+    Example: busy-bridge tool use "Search the web for OpenClaw docs"
+    """
+    _use_tool(client, description)
+
+
+@tool.command("list")
+@pass_client
+def list_tools(client: Busy38Client) -> None:
+    """List available tools."""
+    from ..formatters import format_tool_list
+
+    tools = client.list_tools()
+    _emit(tools, format_tool_list)
+
+
+@tool.command("show")
+@click.argument("name")
+@pass_client
+def show_tool(client: Busy38Client, name: str) -> None:
+    """Show detailed information about a tool."""
+    from ..formatters import format_tool_details
+
+    tool_info = client.lookup_tool(name)
+    _emit(tool_info, format_tool_details)
+
+
+def _make_tool(client: Busy38Client, description: str, follow: bool) -> None:
+    if follow:
+        _reject_json("with --follow")
+    with _maybe_status("[bold green]Starting tool creation mission..."):
+        result = client.make_tool(description)
+
+    mission_id = result.get("mission_id")
+    _emit(
+        result,
+        lambda r: console.print(f"[green]✓[/green] Tool creation mission started: {mission_id}"),
+    )
+
+    if follow:
+        console.print("\n[dim]Following mission progress...[/dim]")
+        if mission_id:
+            _follow_mission_progress(client, mission_id)
+        else:
+            console.print(
+                "[yellow]No mission id returned; use 'show mission' to check status[/yellow]"
+            )
+
+
+@tool.command("make")
+@click.argument("description")
+@click.option("--follow", "-f", is_flag=True, help="Follow mission progress")
+@pass_client
+def make_tool(client: Busy38Client, description: str, follow: bool) -> None:
+    """Create a new tool via mission.
+
+    Example: busy-bridge tool make "Create an RSS reader that checks every 3 hours"
+    """
+    _make_tool(client, description, follow)
@@ -1,27 +1,33 @@
 """HTTP client for Busy38 API."""
 
+import asyncio
 import json
 import time
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, NoReturn, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (busy-bridge[speedups])
+    orjson = None  # type: ignore[assignment]
+
 from .config import Config
 
 
 class Busy38Error(Exception):
     """Error from Busy38 API."""
-    
-    def __init__(self, message: str, status_code: Optional[int] = None, details: Optional[Dict] = None):
+
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, details: Optional[Dict] = None
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.details = details or {}
 
 
-class Busy38Client:
-    """Client for Busy38 orchestrator API."""
-
-    _terminal_mission_states = {
+_TERMINAL_MISSION_STATES = frozenset(
+    {
         "approved",
         "cancelled",
         "completed",
@@ -29,63 +35,111 @@ class Busy38Client:
         "needs_revision",
         "rejected",
     }
-    
+)
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    # orjson parses the raw bytes directly instead of decoding to str first. Its
+    # JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _build_headers(config: Config) -> Dict[str, str]:
+    headers = {
+        "Content-Type": "application/json",
+        "X-Agent-ID": config.agent_id,
+    }
+    if config.api_key:
+        headers["Authorization"] = f"Bearer {config.api_key}"
+    return headers
+
+
+def _pool_limits(config: Config) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def _raise_status_error(e: httpx.HTTPStatusError) -> NoReturn:
+    try:
+        details = _decode_json(e.response)
+    except json.JSONDecodeError:
+        details = {}
+    raise Busy38Error(
+        f"HTTP {e.response.status_code}: {e.response.text}",
+        status_code=e.response.status_code,
+        details=details,
+    )
+
+
+class Busy38Client:
+    """Client for Busy38 orchestrator API."""
+
+    _terminal_mission_states = _TERMINAL_MISSION_STATES
+
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config.load()
+        # retries=1 re-attempts only failed connection setup, never a request
+        # that reached the server, so it is safe for POSTs as well.
         self.client = httpx.Client(
             base_url=self.config.url,
             timeout=self.config.timeout,
             headers=self._headers(),
+            transport=httpx.HTTPTransport(
+                http2=self.config.http2,
+                limits=_pool_limits(self.config),
+                retries=1,
+            ),
         )
-    
+
+    def __enter__(self) -> "Busy38Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        self.client.close()
+
     def _headers(self) -> Dict[str, str]:
         """Build request headers with auth."""
-        headers = {
-            "Content-Type": "application/json",
-            "X-Agent-ID": self.config.agent_id,
-        }
-        if self.config.api_key:
-            headers["Authorization"] = f"Bearer {self.config.api_key}"
-        return headers
-    
+        return _build_headers(self.config)
+
     def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
         """Make an HTTP request."""
         try:
             response = self.client.request(method, path, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return _decode_json(response)
         except httpx.HTTPStatusError as e:
-            try:
-                details = e.response.json()
-            except json.JSONDecodeError:
-                details = {}
-            raise Busy38Error(
-                f"HTTP {e.response.status_code}: {e.response.text}",
-                status_code=e.response.status_code,
-                details=details,
-            )
+            _raise_status_error(e)
         except httpx.RequestError as e:
             raise Busy38Error(f"Request failed: {e}")
-    
+
     # Health
     def health(self) -> Dict[str, Any]:
         """Check API health."""
         return self._request("GET", "/health")
-    
+
     # Tools
     def list_tools(self) -> List[Dict[str, Any]]:
         """List available tools."""
         response = self._request("GET", "/tools")
         return response.get("tools", [])
-    
+
     def lookup_tool(self, name: str) -> Dict[str, Any]:
         """Get full documentation for a tool."""
         return self._request("GET", f"/tools/{name}")
-    
+
     def use_tool(self, description: str) -> Dict[str, Any]:
         """Execute a tool via plain English description."""
         return self._request("POST", "/tools/use", json={"description": description})
-    
+
     # Missions
     def start_mission(
         self,
@@ -104,21 +158,21 @@ class Busy38Client:
             "max_steps": max_steps,
         }
         return self._request("POST", "/missions", json=payload)
-    
+
     def list_missions(self) -> List[Dict[str, Any]]:
         """List all missions."""
         response = self._request("GET", "/missions")
         return response.get("missions", [])
-    
+
     def get_mission(self, mission_id: str) -> Dict[str, Any]:
         """Get mission details."""
         return self._request("GET", f"/missions/{mission_id}")
-    
+
     def get_mission_notes(self, mission_id: str) -> List[Dict[str, Any]]:
         """Get notes for a mission."""
         response = self._request("GET", f"/missions/{mission_id}/notes")
         return response.get("notes", [])
-    
+
     def cancel_mission(self, mission_id: str, reason: str) -> Dict[str, Any]:
         """Cancel a running mission."""
         return self._request(
@@ -126,7 +180,7 @@ class Busy38Client:
             f"/missions/{mission_id}/cancel",
             json={"reason": reason},
         )
-    
+
     def respond_to_mission(self, mission_id: str, response: str) -> Dict[str, Any]:
         """Respond to a mission query."""
         return self._request(
@@ -134,12 +188,12 @@ class Busy38Client:
             f"/missions/{mission_id}/respond",
             json={"response": response},
         )
-    
+
     # Tool Creation (specialized mission)
     def make_tool(self, description: str) -> Dict[str, Any]:
         """Create a new tool via mission."""
         return self._request("POST", "/tools/make", json={"description": description})
-    
+
     # Cheatcodes
     def use_cheatcode(self, namespace: str, action: str, **attributes) -> Dict[str, Any]:
         """Execute a cheatcode."""
@@ -152,7 +206,7 @@ class Busy38Client:
                 "attributes": attributes,
             },
         )
-    
+
     # Streaming for real-time updates (polling fallback)
     def stream_mission(
         self,
@@ -162,8 +216,11 @@ class Busy38Client:
     ) -> Iterator[Dict[str, Any]]:
         """Poll a mission until it reaches a terminal state.
 
-        The API does not currently expose a websocket/SSE stream, so this
-        implementation polls the mission and notes endpoints and yields updates.
+        Polls the mission and notes endpoints and yields updates. The client is
+        pointed at either a Busy38 API or a bridge server, and only the bridge
+        serves `/missions/{id}/events` (SSE). Switching to it would mean
+        guessing which one answered and silently falling back on the other, so
+        streaming stays on the endpoints both expose.
         """
         polls = 0
 
@@ -178,8 +235,168 @@ class Busy38Client:
 
             polls += 1
             if max_polls is not None and polls >= max_polls:
-                raise Busy38Error(
-                    "Mission stream timed out while waiting for terminal state."
-                )
+                raise Busy38Error("Mission stream timed out while waiting for terminal state.")
 
             time.sleep(poll_interval)
+
+
+class AsyncBusy38Client:
+    """Asyncio client for Busy38 orchestrator API.
+
+    Same endpoints as `Busy38Client`; independent calls can be awaited together
+    (e.g. with `asyncio.gather`) and share one keep-alive connection pool sized
+    by the config's pool settings.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config.load()
+        self.client = httpx.AsyncClient(
+            base_url=self.config.url,
+            timeout=self.config.timeout,
+            headers=_build_headers(self.config),
+            transport=httpx.AsyncHTTPTransport(
+                http2=self.config.http2,
+                limits=_pool_limits(self.config),
+                retries=1,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncBusy38Client":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self.client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """Make an HTTP request."""
+        try:
+            response = await self.client.request(method, path, **kwargs)
+            response.raise_for_status()
+            data: Dict[str, Any] = _decode_json(response)
+            return data
+        except httpx.HTTPStatusError as e:
+            _raise_status_error(e)
+        except httpx.RequestError as e:
+            raise Busy38Error(f"Request failed: {e}")
+
+    # Health
+    async def health(self) -> Dict[str, Any]:
+        """Check API health."""
+        return await self._request("GET", "/health")
+
+    # Tools
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        """List available tools."""
+        response = await self._request("GET", "/tools")
+        tools: List[Dict[str, Any]] = response.get("tools", [])
+        return tools
+
+    async def lookup_tool(self, name: str) -> Dict[str, Any]:
+        """Get full documentation for a tool."""
+        return await self._request("GET", f"/tools/{name}")
+
+    async def use_tool(self, description: str) -> Dict[str, Any]:
+        """Execute a tool via plain English description."""
+        return await self._request("POST", "/tools/use", json={"description": description})
+
+    # Missions
+    async def start_mission(
+        self,
+        objective: str,
+        role: str = "mission_agent",
+        acceptance_criteria: Optional[List[str]] = None,
+        allowed_namespaces: Optional[List[str]] = None,
+        max_steps: int = 6,
+    ) -> Dict[str, Any]:
+        """Start a new mission."""
+        payload = {
+            "objective": objective,
+            "role": role,
+            "acceptance_criteria": acceptance_criteria or [],
+            "allowed_namespaces": allowed_namespaces or [],
+            "max_steps": max_steps,
+        }
+        return await self._request("POST", "/missions", json=payload)
+
+    async def list_missions(self) -> List[Dict[str, Any]]:
+        """List all missions."""
+        response = await self._request("GET", "/missions")
+        missions: List[Dict[str, Any]] = response.get("missions", [])
+        return missions
+
+    async def get_mission(self, mission_id: str) -> Dict[str, Any]:
+        """Get mission details."""
+        return await self._request("GET", f"/missions/{mission_id}")
+
+    async def get_mission_notes(self, mission_id: str) -> List[Dict[str, Any]]:
+        """Get notes for a mission."""
+        response = await self._request("GET", f"/missions/{mission_id}/notes")
+        notes: List[Dict[str, Any]] = response.get("notes", [])
+        return notes
+
+    async def cancel_mission(self, mission_id: str, reason: str) -> Dict[str, Any]:
+        """Cancel a running mission."""
+        return await self._request(
+            "POST",
+            f"/missions/{mission_id}/cancel",
+            json={"reason": reason},
+        )
+
+    async def respond_to_mission(self, mission_id: str, response: str) -> Dict[str, Any]:
+        """Respond to a mission query."""
+        return await self._request(
+            "POST",
+            f"/missions/{mission_id}/respond",
+            json={"response": response},
+        )
+
+    # Tool Creation (specialized mission)
+    async def make_tool(self, description: str) -> Dict[str, Any]:
+        """Create a new tool via mission."""
+        return await self._request("POST", "/tools/make", json={"description": description})
+
+    # Cheatcodes
+    async def use_cheatcode(self, namespace: str, action: str, **attributes: Any) -> Dict[str, Any]:
+        """Execute a cheatcode."""
+        return await self._request(
+            "POST",
+            "/cheatcodes/execute",
+            json={
+                "namespace": namespace,
+                "action": action,
+                "attributes": attributes,
+            },
+        )
+
+    async def stream_mission(
+        self,
+        mission_id: str,
+        poll_interval: float = 1.5,
+        max_polls: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Poll a mission until it reaches a terminal state.
+
+        The mission and notes endpoints are fetched concurrently on each poll.
+        """
+        polls = 0
+
+        while True:
+            mission, notes = await asyncio.gather(
+                self.get_mission(mission_id),
+                self.get_mission_notes(mission_id),
+            )
+            yield {"mission": mission, "notes": notes}
+
+            state = mission.get("state", "unknown")
+            if state in _TERMINAL_MISSION_STATES:
+                return
+
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                raise Busy38Error("Mission stream timed out while waiting for terminal state.")
+
+            await asyncio.sleep(poll_interval)
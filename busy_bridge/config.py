@@ -1,18 +1,43 @@
 """Configuration management for Busy Bridge."""
 
+import functools
 import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 
 import yaml
 
+# libyaml's C loader/dumper when PyYAML was built with it; same safe subset
+# either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@dataclass
+
+@functools.lru_cache(maxsize=4)
+def _load_config_data(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns and size are only cache-key parts: an edited file misses the
+    # cache. Callers must not mutate the returned dict.
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+@functools.lru_cache(maxsize=4)
+def _env_fields(url: str, api_key: Optional[str], agent_id: str, timeout: str) -> Mapping[str, Any]:
+    # Keyed on the raw values rather than cached once per process: the daemon's
+    # forked children and tests swap the environment. Read-only view, since
+    # every caller shares it; from_env builds a fresh Config from it each time.
+    return MappingProxyType(
+        {"url": url, "api_key": api_key, "agent_id": agent_id, "timeout": int(timeout)}
+    )
+
+
+@dataclass(slots=True)
 class Config:
     """Busy Bridge configuration."""
-    
+
     url: str = "http://localhost:8080"
     api_key: Optional[str] = None
     agent_id: str = "busy-bridge"
@@ -20,17 +45,25 @@ class Config:
     model_settings: Dict[str, Any] = field(default_factory=dict)
     imported_from: Optional[str] = None
     imported_at: Optional[str] = None
-    
+    # HTTP connection pool. http2 needs the `h2` package (httpx[http2]) and only
+    # takes effect for https:// URLs.
+    http2: bool = False
+    max_connections: int = 64
+    max_keepalive_connections: int = 32
+    keepalive_expiry: float = 30.0
+
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
         return cls(
-            url=os.getenv("BUSY38_URL", "http://localhost:8080"),
-            api_key=os.getenv("BUSY38_API_KEY"),
-            agent_id=os.getenv("BUSY38_AGENT_ID", "busy-bridge"),
-            timeout=int(os.getenv("BUSY38_TIMEOUT", "60")),
+            **_env_fields(
+                os.getenv("BUSY38_URL", "http://localhost:8080"),
+                os.getenv("BUSY38_API_KEY"),
+                os.getenv("BUSY38_AGENT_ID", "busy-bridge"),
+                os.getenv("BUSY38_TIMEOUT", "60"),
+            )
         )
-    
+
     @classmethod
     def from_file(cls, path: Optional[Union[Path, str]] = None) -> "Config":
         """Load configuration from YAML file."""
@@ -38,26 +71,33 @@ class Config:
             path = Path.home() / ".config" / "busy-bridge" / "config.yaml"
         else:
             path = Path(path)
-        
-        if not path.exists():
+
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return cls.from_env()
-        
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
-        
+
+        data = _load_config_data(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
         # Environment variables override file config
         env_config = cls.from_env()
-        
+
         return cls(
             url=data.get("url", env_config.url),
             api_key=data.get("api_key", env_config.api_key),
             agent_id=data.get("agent_id", env_config.agent_id),
             timeout=data.get("timeout", env_config.timeout),
-            model_settings=data.get("model_settings", {}) or {},
+            model_settings=dict(data.get("model_settings", {}) or {}),
             imported_from=data.get("imported_from"),
             imported_at=data.get("imported_at"),
+            http2=data.get("http2", env_config.http2),
+            max_connections=data.get("max_connections", env_config.max_connections),
+            max_keepalive_connections=data.get(
+                "max_keepalive_connections", env_config.max_keepalive_connections
+            ),
+            keepalive_expiry=data.get("keepalive_expiry", env_config.keepalive_expiry),
         )
-    
+
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from all sources (file + env override)."""
@@ -80,13 +120,22 @@ class Config:
             out["imported_from"] = self.imported_from
         if self.imported_at:
             out["imported_at"] = self.imported_at
+        # Pool settings are only written once they differ from the defaults.
+        defaults = Config()
+        for key in ("http2", "max_connections", "max_keepalive_connections", "keepalive_expiry"):
+            value = getattr(self, key)
+            if value != getattr(defaults, key):
+                out[key] = value
         return out
 
     def save(self, path: Optional[Union[Path, str]] = None) -> Path:
         save_path = Path(path) if path is not None else self.default_path()
         save_path.parent.mkdir(parents=True, exist_ok=True)
+        # Render to one string first: the emitter otherwise issues a write per
+        # token to the file object.
+        text = yaml.dump(self.to_dict(), Dumper=_YAML_DUMPER, sort_keys=True)
         with open(save_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(self.to_dict(), f, sort_keys=True)
+            f.write(text)
         return save_path
 
     def apply_model_import(self, source: str, settings: Dict[str, Any]) -> None:
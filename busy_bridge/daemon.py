@@ -0,0 +1,444 @@
+"""Warm local daemon for repeated CLI calls, and the thin client that talks to it.
+
+`busy-bridge daemon start` imports the CLI once and listens on a Unix socket.
+`busy-bridge-fast ARGS...` sends its argv, environment and cwd over that socket;
+the daemon forks, runs the command in the child against the already-imported
+modules and streams stdout/stderr back, followed by the exit status.
+
+Wire protocol (newline-delimited JSON, one object per line):
+
+    client -> daemon  {"argv": [...], "env": {...}, "cwd": "...", "tty": bool}
+                      or {"control": "ping" | "stop"}
+    daemon -> client  {"stream": "stdout" | "stderr", "data": "..."} ...
+                      {"exit": int}
+
+Only stdlib is imported at module level so the thin client stays cheap. stdin is
+not forwarded; no command reads it. Only the environment variables the CLI and
+its libraries read are forwarded (see `_forwarded_env`), and both ends check
+that the other side of the socket runs as the same user before trusting it.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+_SOCKET_ENV = "BUSY_BRIDGE_DAEMON_SOCKET"
+_REQUEST_TIMEOUT = 5.0
+
+# Modules the daemon imports up front so forked children start warm.
+_PRELOAD_MODULES = (
+    "busy_bridge.cli",
+    "busy_bridge.client",
+    "busy_bridge.config",
+    "busy_bridge.formatters",
+    "busy_bridge.import_settings",
+    "busy_bridge.cli_cmds.cheatcode",
+    "busy_bridge.cli_cmds.health",
+    "busy_bridge.cli_cmds.mission",
+    "busy_bridge.cli_cmds.settings",
+    "busy_bridge.cli_cmds.shortcuts",
+    "busy_bridge.cli_cmds.tool",
+    "rich.console",
+    "rich.panel",
+    "rich.table",
+    "rich.text",
+)
+
+
+class DaemonError(Exception):
+    """Daemon could not be started or a request was rejected."""
+
+
+def socket_path() -> Path:
+    """Socket location: $BUSY_BRIDGE_DAEMON_SOCKET, else the per-user runtime dir.
+
+    Without XDG_RUNTIME_DIR the socket lives in a per-user 0700 directory under
+    the temp dir; `serve` creates it and refuses one that another user owns.
+    """
+    override = os.getenv(_SOCKET_ENV)
+    if override:
+        return Path(override).expanduser()
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "busy-bridge.sock"
+    return _private_tmp_dir() / "daemon.sock"
+
+
+def _private_tmp_dir() -> Path:
+    return Path(tempfile.gettempdir()) / f"busy-bridge-{os.getuid()}"
+
+
+def _ensure_private_dir(directory: Path) -> None:
+    # The temp dir is shared, so the name can be squatted: create it 0700 and
+    # accept an existing one only if it is ours and closed to everyone else.
+    try:
+        directory.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    info = directory.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise DaemonError(f"{directory} is not a directory owned by the current user")
+    if info.st_mode & 0o077:
+        raise DaemonError(f"{directory} must not be accessible to other users (mode 0700)")
+
+
+# Environment the CLI (and Click, Rich, httpx under it) reads. Everything else in
+# the caller's environment stays out of the request.
+_FORWARDED_ENV_PREFIXES = ("BUSY38_", "BUSY_", "SQUIDKEYS_", "LC_")
+_FORWARDED_ENV_NAMES = frozenset(
+    {
+        "HOME",
+        "USER",
+        "LOGNAME",
+        "PATH",
+        "TMPDIR",
+        "LANG",
+        "TERM",
+        "COLORTERM",
+        "NO_COLOR",
+        "FORCE_COLOR",
+        "COLUMNS",
+        "LINES",
+        "XDG_CONFIG_HOME",
+        "XDG_RUNTIME_DIR",
+        "HTTP_PROXY",
+        "HTTPS_PROXY",
+        "ALL_PROXY",
+        "NO_PROXY",
+        "http_proxy",
+        "https_proxy",
+        "all_proxy",
+        "no_proxy",
+        "SSL_CERT_FILE",
+        "SSL_CERT_DIR",
+    }
+)
+
+
+def _forwarded_env(environ: Dict[str, str]) -> Dict[str, str]:
+    return {
+        key: value
+        for key, value in environ.items()
+        if key in _FORWARDED_ENV_NAMES or key.startswith(_FORWARDED_ENV_PREFIXES)
+    }
+
+
+def _send(conn: socket.socket, message: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _recv_line(stream: io.BufferedReader) -> Optional[Dict[str, Any]]:
+    line = stream.readline()
+    if not line:
+        return None
+    frame: Dict[str, Any] = json.loads(line)
+    return frame
+
+
+def _connect(path: Path) -> Optional[socket.socket]:
+    """Connected socket, or None when no daemon is listening at `path`.
+
+    Raises DaemonError when the listener is not running as the current user:
+    requests carry the caller's credentials and must never reach anyone else.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except (FileNotFoundError, ConnectionRefusedError, ConnectionResetError):
+        # Reset: the listener closed between accept and our connect, i.e. the
+        # daemon is shutting down.
+        sock.close()
+        return None
+    try:
+        peer = _peer_uid(sock)
+    except BaseException:
+        sock.close()
+        raise
+    if peer != os.getuid():
+        sock.close()
+        raise DaemonError(f"refusing {path}: listener runs as uid {peer}, not {os.getuid()}")
+    return sock
+
+
+def _peercred_option() -> Optional[Tuple[int, int, str]]:
+    """(level, option, struct format) for reading a Unix socket peer's uid."""
+    so_peercred = getattr(socket, "SO_PEERCRED", None)
+    if so_peercred is not None:
+        # Linux: struct ucred {pid_t pid; uid_t uid; gid_t gid;}
+        return socket.SOL_SOCKET, so_peercred, "3i"
+    local_peercred = getattr(socket, "LOCAL_PEERCRED", None)
+    if local_peercred is not None:
+        # macOS/BSD (what getpeereid() reads): struct xucred
+        # {u_int cr_version; uid_t cr_uid; short cr_ngroups; gid_t cr_groups[16];}
+        return getattr(socket, "SOL_LOCAL", 0), local_peercred, "=IIh2x16I"
+    return None
+
+
+def _peer_uid(conn: socket.socket) -> int:
+    option = _peercred_option()
+    if option is None:
+        raise DaemonError("this platform cannot report Unix socket peer credentials")
+    level, name, fmt = option
+    creds = conn.getsockopt(level, name, struct.calcsize(fmt))
+    uid: int = struct.unpack(fmt, creds)[1]
+    return uid
+
+
+def _validate_request(request: Any) -> Dict[str, Any]:
+    # Requests carry argv and environment that the child executes with; reject
+    # anything that is not exactly the documented shape.
+    if not isinstance(request, dict):
+        raise DaemonError("request must be a JSON object")
+    argv, env, cwd = request.get("argv"), request.get("env"), request.get("cwd")
+    if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+        raise DaemonError("argv must be a list of strings")
+    if not isinstance(env, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in env.items()
+    ):
+        raise DaemonError("env must map strings to strings")
+    if not isinstance(cwd, str):
+        raise DaemonError("cwd must be a string")
+    if not isinstance(request.get("tty", False), bool):
+        raise DaemonError("tty must be a boolean")
+    return request
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as one frame."""
+
+    def __init__(self, conn: socket.socket, stream: str, tty: bool) -> None:
+        super().__init__()
+        self._conn = conn
+        self._stream = stream
+        self._tty = tty
+
+    # io.TextIOBase exposes encoding as a read-only getter; typeshed declares it
+    # as a plain attribute, hence the ignore.
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return "utf-8"
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str | bytes) -> int:
+        # click.echo writes bytes when it cannot find a binary buffer to use.
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="replace")
+        if data:
+            _send(self._conn, {"stream": self._stream, "data": data})
+        return len(data)
+
+
+def _run_in_child(conn: socket.socket, request: Dict[str, Any]) -> int:
+    try:
+        os.chdir(request["cwd"])
+    except OSError as e:
+        # The caller's cwd was deleted or is not accessible to the daemon;
+        # running the command anywhere else could act on the wrong files.
+        _send(conn, {"stream": "stderr", "data": f"busy-bridge daemon: {e}\n"})
+        return 1
+    os.environ.clear()
+    os.environ.update(request["env"])
+
+    tty = request.get("tty", False)
+    sys.stdout = _FrameWriter(conn, "stdout", tty)
+    sys.stderr = _FrameWriter(conn, "stderr", tty)
+
+    from . import cli as cli_module
+    from . import formatters
+
+    # Rich fixes the colour system when a Console is built; build fresh ones
+    # against this request's stream instead of inheriting the daemon's.
+    cli_module._console.cache_clear()
+    formatters._console.cache_clear()
+    try:
+        cli_module.cli.main(args=request["argv"], prog_name="busy-bridge")
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _handle_in_child(conn: socket.socket, request: Dict[str, Any]) -> None:
+    try:
+        code = _run_in_child(conn, request)
+        _send(conn, {"exit": code})
+    finally:
+        conn.close()
+
+
+def serve(path: Optional[Path] = None, *, ready: Optional[TextIO] = None) -> None:
+    """Listen on `path` until a stop request arrives. Blocks the caller."""
+    import importlib
+
+    # Without peer credentials any local user could have requests executed.
+    if _peercred_option() is None:
+        raise DaemonError("this platform cannot report Unix socket peer credentials")
+
+    path = path or socket_path()
+    if path.parent == _private_tmp_dir():
+        _ensure_private_dir(path.parent)
+    probe = _connect(path)
+    if probe is not None:
+        probe.close()
+        raise DaemonError(f"a daemon is already listening on {path}")
+    try:
+        existing = path.lstat()
+    except FileNotFoundError:
+        existing = None
+    if existing is not None:
+        if not stat.S_ISSOCK(existing.st_mode):
+            raise DaemonError(f"{path} exists and is not a socket; refusing to replace it")
+        # Socket file left behind by a daemon that did not shut down cleanly.
+        path.unlink()
+
+    for name in _PRELOAD_MODULES:
+        importlib.import_module(name)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        listener.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    listener.listen(16)
+
+    # Children are never waited on; let the kernel reap them.
+    previous_sigchld = signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    if ready is not None:
+        ready.write(f"{path}\n")
+        ready.flush()
+    try:
+        while True:
+            conn, _ = listener.accept()
+            try:
+                peer = _peer_uid(conn)
+            except OSError:
+                peer = None
+            if peer != os.getuid():
+                conn.close()
+                continue
+            try:
+                conn.settimeout(_REQUEST_TIMEOUT)
+                with conn.makefile("rb") as stream:
+                    raw = _recv_line(stream)
+                conn.settimeout(None)
+                if raw is None:
+                    conn.close()
+                    continue
+                control = raw.get("control") if isinstance(raw, dict) else None
+                if control == "ping":
+                    _send(conn, {"exit": 0, "pid": os.getpid()})
+                    conn.close()
+                    continue
+                if control == "stop":
+                    _send(conn, {"exit": 0})
+                    conn.close()
+                    break
+                request = _validate_request(raw)
+            except (DaemonError, ValueError, OSError) as e:
+                try:
+                    _send(conn, {"stream": "stderr", "data": f"busy-bridge daemon: {e}\n"})
+                    _send(conn, {"exit": 2})
+                except OSError:
+                    pass
+                conn.close()
+                continue
+
+            pid = os.fork()
+            if pid == 0:
+                listener.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                try:
+                    _handle_in_child(conn, request)
+                finally:
+                    os._exit(0)
+            conn.close()
+    finally:
+        signal.signal(signal.SIGCHLD, previous_sigchld)
+        listener.close()
+        path.unlink(missing_ok=True)
+
+
+def send_control(command: str, path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Send a control request; None when no daemon is listening."""
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return None
+    with sock, sock.makefile("rb") as stream:
+        try:
+            _send(sock, {"control": command})
+            return _recv_line(stream)
+        except (ConnectionResetError, BrokenPipeError):
+            # The daemon closed the connection unanswered: it is shutting down.
+            return None
+
+
+def run_client(
+    argv: list[str],
+    *,
+    path: Optional[Path] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """Run `argv` through the daemon; returns its exit status, or None if none is running."""
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    sock = _connect(path or socket_path())
+    if sock is None:
+        return None
+
+    env = _forwarded_env(dict(os.environ))
+    if stdout.isatty():
+        env.setdefault("COLUMNS", str(os.get_terminal_size(stdout.fileno()).columns))
+    request = {"argv": argv, "env": env, "cwd": os.getcwd(), "tty": stdout.isatty()}
+    targets = {"stdout": stdout, "stderr": stderr}
+    with sock, sock.makefile("rb") as stream:
+        _send(sock, request)
+        while True:
+            frame = _recv_line(stream)
+            if frame is None:
+                raise DaemonError("daemon closed the connection before reporting an exit status")
+            if "exit" in frame:
+                stdout.flush()
+                return int(frame["exit"])
+            targets[frame["stream"]].write(frame["data"])
+
+
+def client_main() -> None:
+    """Entry point for `busy-bridge-fast`: use the daemon when one is running."""
+    try:
+        code = run_client(sys.argv[1:])
+    except DaemonError as e:
+        print(f"busy-bridge-fast: {e}", file=sys.stderr)
+        sys.exit(1)
+    if code is None:
+        # No daemon listening: run the command in this process instead.
+        from .__main__ import main
+
+        main()
+        return
+    sys.exit(code)
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import os
 import re
 import importlib.util
 import sys
 import types
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import yaml
 
@@ -19,6 +22,20 @@ try:
 except Exception:  # pragma: no cover
     tomllib = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (busy-bridge[speedups])
+    orjson = None  # type: ignore[assignment]
+
+_PARSE_WORKERS = 8
+
+# libyaml's C loader when PyYAML was built with it; same safe subset either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# orjson's JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+# both parsers the same way.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 SYSTEM_CONFIG_CANDIDATES: Dict[str, List[str]] = {
     "openclaw": [
@@ -85,14 +102,30 @@ SYSTEM_CONFIG_CANDIDATES: Dict[str, List[str]] = {
     ],
 }
 
-SECRET_KEY_RE = re.compile(r"(api[_-]?key|access[_-]?token|refresh[_-]?token|token|secret|password)", re.IGNORECASE)
+# SYSTEM_CONFIG_CANDIDATES split into path components once at import, plus the
+# system order used when no source is given; detection walks these directly.
+_CANDIDATE_PARTS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    system: tuple(tuple(rel.split("/")) for rel in rels)
+    for system, rels in SYSTEM_CONFIG_CANDIDATES.items()
+}
+_ALL_SYSTEMS: Tuple[str, ...] = tuple(sorted(SYSTEM_CONFIG_CANDIDATES))
+
+# Reference definition of a secret-looking key; _is_secret_key_name implements
+# the same match without the regex engine.
+SECRET_KEY_RE = re.compile(
+    r"(api[_-]?key|access[_-]?token|refresh[_-]?token|token|secret|password)", re.IGNORECASE
+)
 PLACEHOLDER_SECRET_RE = re.compile(
     r"^(your[-_ ]?|example[-_ ]?|changeme|replaceme|test|dummy|placeholder)",
     re.IGNORECASE,
 )
 
+# PLACEHOLDER_SECRET_RE as plain prefixes (its optional separators never change
+# whether it matches); str.startswith with a tuple skips the regex engine.
+_PLACEHOLDER_PREFIXES = ("your", "example", "changeme", "replaceme", "test", "dummy", "placeholder")
 
-@dataclass
+
+@dataclass(slots=True)
 class DetectionResult:
     system: str
     config_path: Path
@@ -112,18 +145,33 @@ class SquidStoreImportResult:
 
 
 def _dedupe_paths(paths: Iterable[Path]) -> List[Path]:
+    # Lexical absolute paths: no filesystem access, unlike resolve(). Roots that
+    # alias through a symlink are not merged here; their hits share a resolved
+    # config_path and are deduplicated in the detection results instead.
     seen = set()
     out: List[Path] = []
     for p in paths:
-        rp = p.expanduser().resolve()
-        key = str(rp)
-        if key in seen:
+        rp = Path(os.path.abspath(p.expanduser()))
+        if rp in seen:
             continue
-        seen.add(key)
+        seen.add(rp)
         out.append(rp)
     return out
 
 
+@functools.lru_cache(maxsize=1024)
+def _realpath(path: str) -> str:
+    # Callers pass absolute paths, so the cache key does not depend on the cwd.
+    # realpath walks every component with lstat/readlink; detection and store
+    # imports resolve the same handful of paths over and over.
+    return os.path.realpath(path)
+
+
+def _resolve_path(path: Any) -> Path:
+    """Cached `Path(path).expanduser().resolve()`."""
+    return Path(_realpath(os.path.abspath(os.path.expanduser(path))))
+
+
 def _default_scan_roots() -> List[Path]:
     roots = [
         Path.home(),
@@ -139,14 +187,22 @@ def _default_scan_roots() -> List[Path]:
     return _dedupe_paths(roots)
 
 
-def _flatten_dict(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+def _flatten_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Explicit stack of item iterators instead of recursion: no per-level dict
+    # to merge, no recursion limit on deeply nested configs, and leaves still
+    # come out in depth-first order (later duplicates win, as before).
     out: Dict[str, Any] = {}
-    for k, v in (data or {}).items():
-        key = f"{prefix}.{k}" if prefix else str(k)
-        if isinstance(v, dict):
-            out.update(_flatten_dict(v, key))
-        else:
+    stack = [("", iter((data or {}).items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            key = f"{prefix}.{k}" if prefix else str(k)
+            if isinstance(v, dict):
+                stack.append((key, iter(v.items())))
+                break
             out[key] = v
+        else:
+            stack.pop()
     return out
 
 
@@ -154,13 +210,21 @@ def _parse_env_text(text: str) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     for line in (text or "").splitlines():
         s = line.strip()
-        if not s or s.startswith("#") or "=" not in s:
+        if not s or s[0] == "#":
+            continue
+        k, sep, v = s.partition("=")
+        if not sep:
+            continue
+        key = k.rstrip()
+        if not key:
             continue
-        k, v = s.split("=", 1)
-        key = k.strip()
-        val = v.strip().strip("\"").strip("'")
-        if key:
-            out[key] = val
+        # The line is already stripped, so only the value's left edge needs it.
+        # Unquote one matching pair with a single slice; a lone or mismatched
+        # quote is part of the value rather than silently dropped.
+        val = v.lstrip()
+        if len(val) >= 2 and val[0] == val[-1] and val[0] in "\"'":
+            val = val[1:-1]
+        out[key] = val
     return out
 
 
@@ -173,11 +237,11 @@ def _parse_config(path: Path) -> Dict[str, Any]:
         return _parse_env_text(text)
 
     if suffix in (".yaml", ".yml"):
-        data = yaml.safe_load(text) or {}
+        data = yaml.load(text, Loader=_YAML_LOADER) or {}
         return data if isinstance(data, dict) else {}
 
     if suffix == ".json":
-        data = json.loads(text or "{}")
+        data = _json_loads(text or "{}")
         return data if isinstance(data, dict) else {}
 
     if suffix == ".toml" and tomllib is not None:
@@ -188,9 +252,9 @@ def _parse_config(path: Path) -> Dict[str, Any]:
     for parser in ("yaml", "json", "toml"):
         try:
             if parser == "yaml":
-                data = yaml.safe_load(text) or {}
+                data = yaml.load(text, Loader=_YAML_LOADER) or {}
             elif parser == "json":
-                data = json.loads(text or "{}")
+                data = _json_loads(text or "{}")
             else:
                 if tomllib is None:
                     continue
@@ -203,6 +267,14 @@ def _parse_config(path: Path) -> Dict[str, Any]:
     return {}
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns and size are only cache-key parts: an edited file misses the
+    # cache. Callers must not mutate the returned dict. In memory only:
+    # parsed configs carry plaintext secrets.
+    return _parse_config(Path(path))
+
+
 def _normalize_key_name(key: str) -> str:
     out = re.sub(r"[^A-Za-z0-9]+", "_", str(key)).strip("_").lower()
     return out[:120] if out else "value"
@@ -214,79 +286,157 @@ def _is_probable_secret(key: str, value: Any) -> bool:
     raw = value.strip()
     if len(raw) < 10:
         return False
-    if PLACEHOLDER_SECRET_RE.match(raw):
+    if raw.casefold().startswith(_PLACEHOLDER_PREFIXES):
         return False
-    return bool(SECRET_KEY_RE.search(key))
+    return _is_secret_key_name(key)
+
+
+def _is_secret_key_name(key: str) -> bool:
+    # Same answer as SECRET_KEY_RE.search(key): access/refresh_token both
+    # contain "token", so the alternation reduces to four substrings. Plain
+    # `in` checks on a casefolded key avoid the regex engine trying every
+    # alternative at every offset, which made this the hot spot per flattened
+    # key. casefold() matches IGNORECASE on non-ASCII letters (e.g. the Kelvin
+    # sign), which lower() would not.
+    k = key.casefold()
+    return (
+        "token" in k
+        or "secret" in k
+        or "password" in k
+        or "apikey" in k
+        or "api_key" in k
+        or "api-key" in k
+    )
 
 
-def _extract_model_settings(data: Dict[str, Any]) -> Dict[str, Any]:
-    flat = _flatten_dict(data)
-    out: Dict[str, Any] = {}
+# Output key -> flattened source keys, in priority order. Module-level so the
+# table is built once rather than on every extraction.
+_MODEL_KEY_MAP: Dict[str, Tuple[str, ...]] = {
+    "model": (
+        "model",
+        "default_model",
+        "llm.model",
+        "models.default",
+        "inference.model",
+    ),
+    "provider": (
+        "provider",
+        "llm.provider",
+        "inference.provider",
+    ),
+    "base_url": (
+        "base_url",
+        "api_base",
+        "llm.base_url",
+        "inference.base_url",
+    ),
+    "temperature": (
+        "temperature",
+        "llm.temperature",
+        "inference.temperature",
+    ),
+    "max_tokens": (
+        "max_tokens",
+        "llm.max_tokens",
+        "inference.max_tokens",
+    ),
+}
 
-    key_map = {
-        "model": [
-            "model",
-            "default_model",
-            "llm.model",
-            "models.default",
-            "inference.model",
-        ],
-        "provider": [
-            "provider",
-            "llm.provider",
-            "inference.provider",
-        ],
-        "base_url": [
-            "base_url",
-            "api_base",
-            "llm.base_url",
-            "inference.base_url",
-        ],
-        "temperature": [
-            "temperature",
-            "llm.temperature",
-            "inference.temperature",
-        ],
-        "max_tokens": [
-            "max_tokens",
-            "llm.max_tokens",
-            "inference.max_tokens",
-        ],
-    }
+_AGENT_KEY_MAP: Dict[str, Tuple[str, ...]] = {
+    "agent_name": ("agent_name", "agent.name", "name", "profile.name"),
+    "agent_id": ("agent_id", "agent.id", "id", "profile.id"),
+    "persona": ("persona", "agent.persona", "profile.persona"),
+    "role": ("role", "agent.role", "profile.role"),
+}
 
-    for out_key, candidates in key_map.items():
-        for c in candidates:
-            if c in flat and flat[c] not in (None, ""):
-                out[out_key] = flat[c]
-                break
 
-    return out
+# The _extract_* helpers take a nested config; detection flattens once and
+# calls the *_flat variants so the three extractors share one flattened dict.
+def _extract_model_settings(data: Dict[str, Any]) -> Dict[str, Any]:
+    return _extract_model_settings_flat(_flatten_dict(data))
 
 
 def _extract_agent_settings(data: Dict[str, Any]) -> Dict[str, Any]:
-    flat = _flatten_dict(data)
+    return _extract_agent_settings_flat(_flatten_dict(data))
+
+
+def _extract_secrets(data: Dict[str, Any]) -> Dict[str, str]:
+    return _extract_secrets_flat(_flatten_dict(data))
+
+
+def _pick_first_set(flat: Dict[str, Any], key_map: Dict[str, Tuple[str, ...]]) -> Dict[str, Any]:
+    # One .get per candidate instead of `in` plus `[]`: a missing key reads as
+    # None, which is skipped exactly like an explicit None or "".
     out: Dict[str, Any] = {}
-    key_map = {
-        "agent_name": ["agent_name", "agent.name", "name", "profile.name"],
-        "agent_id": ["agent_id", "agent.id", "id", "profile.id"],
-        "persona": ["persona", "agent.persona", "profile.persona"],
-        "role": ["role", "agent.role", "profile.role"],
-    }
     for out_key, candidates in key_map.items():
         for c in candidates:
-            if c in flat and flat[c] not in (None, ""):
-                out[out_key] = flat[c]
+            v = flat.get(c)
+            if v not in (None, ""):
+                out[out_key] = v
                 break
     return out
 
 
-def _extract_secrets(data: Dict[str, Any]) -> Dict[str, str]:
-    flat = _flatten_dict(data)
+def _extract_model_settings_flat(flat: Dict[str, Any]) -> Dict[str, Any]:
+    return _pick_first_set(flat, _MODEL_KEY_MAP)
+
+
+def _extract_agent_settings_flat(flat: Dict[str, Any]) -> Dict[str, Any]:
+    return _pick_first_set(flat, _AGENT_KEY_MAP)
+
+
+def _extract_secrets_flat(flat: Dict[str, Any]) -> Dict[str, str]:
     out: Dict[str, str] = {}
     for key, value in flat.items():
         if _is_probable_secret(key, value):
             out[_normalize_key_name(key)] = str(value).strip()
-    return out
+    # Sorted once here so importing (which writes in dict order) is
+    # deterministic without re-sorting per import.
+    return dict(sorted(out.items()))
+
+
+def _scan_dir(path: str) -> Dict[str, os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _load_candidate(entry: os.DirEntry[str]) -> Optional[Dict[str, Any]]:
+    """Parsed contents of a candidate file, or None if it cannot be read or parsed."""
+    try:
+        st = entry.stat()
+        return _parse_config_cached(entry.path, st.st_mtime_ns, st.st_size)
+    except Exception:
+        return None
+
+
+def _find_candidate_file(
+    root: str, parts: Tuple[str, ...], listings: Dict[str, Dict[str, os.DirEntry[str]]]
+) -> Optional[os.DirEntry[str]]:
+    """Directory entry for `root/<parts>` if it is a regular file, else None.
+
+    Walks `parts` one component at a time against directory listings that are
+    shared across every candidate of a scan: one scandir per existing directory
+    replaces a stat per candidate, and a missing `.config/<system>` or
+    `.<system>` directory rules out all of that system's files at once.
+    """
+    current = root
+    last = len(parts) - 1
+    for i, part in enumerate(parts):
+        listing = listings.get(current)
+        if listing is None:
+            listing = listings[current] = _scan_dir(current)
+        entry = listing.get(part)
+        if entry is None:
+            return None
+        if i == last:
+            return entry if entry.is_file() else None
+        if not entry.is_dir():
+            return None
+        current = entry.path
+    return None
 
 
 def detect_installed_system_configs(
@@ -294,62 +444,113 @@ def detect_installed_system_configs(
     source: Optional[str] = None,
     roots: Optional[List[Path]] = None,
 ) -> List[DetectionResult]:
+    # Not memoised: every call rescans, so a config written since the last call
+    # is found, and each caller gets its own results to mutate. Unchanged files
+    # are not re-parsed (see _parse_config_cached).
     scan_roots = roots or _default_scan_roots()
-    systems = [source] if source else sorted(SYSTEM_CONFIG_CANDIDATES.keys())
-    out: List[DetectionResult] = []
+    systems = (source,) if source else _ALL_SYSTEMS
+    # Flat (system position, candidate position, system, path parts) list so
+    # each root is visited once for every system instead of once per system.
+    probes = [
+        (si, ci, system, parts)
+        for si, system in enumerate(systems)
+        for ci, parts in enumerate(_CANDIDATE_PARTS.get(system, ()))
+    ]
+    found: List[Tuple[Tuple[int, int, int], str, os.DirEntry[str]]] = []
+    listings: Dict[str, Dict[str, os.DirEntry[str]]] = {}
+
+    for ri, root in enumerate(scan_roots):
+        root_str = os.fspath(root)
+        listing = listings[root_str] = _scan_dir(root_str)
+        if not listing:
+            # Missing or empty root: nothing under it can match.
+            continue
+        for si, ci, system, parts in probes:
+            entry = _find_candidate_file(root_str, parts, listings)
+            if entry is not None:
+                found.append(((si, ri, ci), system, entry))
+
+    # Callers (settings import) take the first result, so keep the documented
+    # system -> root -> candidate order regardless of the scan order above.
+    found.sort(key=lambda hit: hit[0])
+
+    # Reading and parsing are independent per file; overlap them when there is
+    # more than one, since a cold page cache or network home directory makes
+    # each read wait on I/O.
+    entries = [entry for _, _, entry in found]
+    if len(entries) > 1:
+        with ThreadPoolExecutor(max_workers=min(_PARSE_WORKERS, len(entries))) as pool:
+            parsed = list(pool.map(_load_candidate, entries))
+    else:
+        parsed = [_load_candidate(entry) for entry in entries]
 
-    for system in systems:
-        if not system:
+    out: List[DetectionResult] = []
+    seen_paths = set()
+    for (_, system, entry), data in zip(found, parsed):
+        if data is None:
             continue
-        candidates = SYSTEM_CONFIG_CANDIDATES.get(system, [])
-        if not candidates:
+        flat = _flatten_dict(data)
+        # Leaf values (e.g. lists) still belong to the cached parse; copy them
+        # so a caller editing its result cannot change the next detection.
+        model_settings = copy.deepcopy(_extract_model_settings_flat(flat))
+        agent_settings = copy.deepcopy(_extract_agent_settings_flat(flat))
+        secrets = _extract_secrets_flat(flat)
+        if not model_settings and not agent_settings and not secrets:
             continue
-        for root in scan_roots:
-            for rel in candidates:
-                cfg_path = root / rel
-                if not cfg_path.exists() or not cfg_path.is_file():
-                    continue
-                try:
-                    data = _parse_config(cfg_path)
-                except Exception:
-                    continue
-                model_settings = _extract_model_settings(data)
-                agent_settings = _extract_agent_settings(data)
-                secrets = _extract_secrets(data)
-                if not model_settings and not agent_settings and not secrets:
-                    continue
-                out.append(
-                    DetectionResult(
-                        system=system,
-                        config_path=cfg_path.resolve(),
-                        model_settings=model_settings,
-                        agent_settings=agent_settings,
-                        secrets=secrets,
-                    )
-                )
+        config_path = _resolve_path(entry.path)
+        if config_path in seen_paths:
+            continue
+        seen_paths.add(config_path)
+        out.append(
+            DetectionResult(
+                system=system,
+                config_path=config_path,
+                model_settings=model_settings,
+                agent_settings=agent_settings,
+                secrets=secrets,
+            )
+        )
     return out
 
 
+# (BUSY_BRIDGE_KEY_STORE_SRC, cwd) -> loaded KeyStore class, so the key_store
+# modules are not re-executed per call. Only hits are remembered: a checkout
+# created or fixed after a failed lookup must still be found by a long-running
+# process. The class keeps its own module objects alive after sys.modules is
+# restored.
+_keystore_class_hits: Dict[Tuple[str, str], type[Any]] = {}
+
+
 def _resolve_keystore_class() -> Optional[type[Any]]:
+    key = (os.getenv("BUSY_BRIDGE_KEY_STORE_SRC", "").strip(), os.getcwd())
+    hit = _keystore_class_hits.get(key)
+    if hit is not None:
+        return hit
+    found = _load_keystore_class(*key)
+    if found is not None:
+        _keystore_class_hits[key] = found
+    return found
+
+
+def _load_keystore_class(raw: str, cwd: str) -> Optional[type[Any]]:
     # `key_store` is a common module name; we may already have a different library
     # installed that occupies it. For SquidKeys, we force-load the local repo
     # modules under the real `key_store.*` names temporarily so imports resolve.
 
     candidates: List[Path] = []
-    raw = os.getenv("BUSY_BRIDGE_KEY_STORE_SRC", "").strip()
     if raw:
         candidates.append(Path(raw))
 
     candidates.extend(
         [
             Path("/home/lynn/projects/key-store/src"),
-            Path.cwd().parent / "key-store" / "src",
-            Path.cwd() / "key-store" / "src",
+            Path(cwd).parent / "key-store" / "src",
+            Path(cwd) / "key-store" / "src",
         ]
     )
 
     for base in candidates:
-        src = base.expanduser().resolve()
+        src = _resolve_path(base)
         pkg_dir = src / "key_store"
         models_py = pkg_dir / "models.py"
         store_py = pkg_dir / "store.py"
@@ -411,91 +612,154 @@ def import_detection_to_squid_store(
     import_secrets: bool = True,
     import_settings: bool = True,
 ) -> SquidStoreImportResult:
+    return import_detections_to_squid_store(
+        [detection],
+        target_agent_id=target_agent_id,
+        actor=actor,
+        db_path=db_path,
+        import_secrets=import_secrets,
+        import_settings=import_settings,
+    )[0]
+
+
+def import_detections_to_squid_store(
+    detections: Sequence[DetectionResult],
+    *,
+    target_agent_id: str = "busy-bridge",
+    actor: str = "busy-bridge",
+    db_path: Optional[Path] = None,
+    import_secrets: bool = True,
+    import_settings: bool = True,
+) -> List[SquidStoreImportResult]:
+    """Import several detections through one Squid store connection.
+
+    Opening the store (a DuckDB database) dominates a single import, so a batch
+    opens it once. Returns one result per detection, in order.
+    """
+    if not detections:
+        return []
+
     keystore_cls = _resolve_keystore_class()
-    resolved_db = Path(db_path or os.getenv("SQUIDKEYS_DB_PATH", "./data/keystore.duckdb")).expanduser().resolve()
+    resolved_db = _resolve_path(db_path or os.getenv("SQUIDKEYS_DB_PATH", "./data/keystore.duckdb"))
 
     if keystore_cls is None:
-        return SquidStoreImportResult(
-            success=False,
-            db_path=resolved_db,
-            source_system=detection.system,
-            errors=[
-                "key_store module not available. Install key-store (recommended: pip install -e ../key-store) and ensure duckdb+cryptography are installed."
-            ],
-        )
+        return [
+            SquidStoreImportResult(
+                success=False,
+                db_path=resolved_db,
+                source_system=detection.system,
+                errors=[
+                    "key_store module not available. Install key-store (recommended: pip install -e ../key-store) and ensure duckdb+cryptography are installed."
+                ],
+            )
+            for detection in detections
+        ]
 
-    imported_secret_count = 0
-    imported_settings_count = 0
-    errors: List[str] = []
+    try:
+        store = _open_store(keystore_cls, resolved_db)
+    except Exception as exc:
+        return [
+            SquidStoreImportResult(
+                success=False,
+                db_path=resolved_db,
+                source_system=detection.system,
+                errors=[f"failed to initialize squid store: {exc}"],
+            )
+            for detection in detections
+        ]
 
     try:
+        return [
+            _import_into_store(
+                store,
+                detection,
+                db_path=resolved_db,
+                target_agent_id=target_agent_id,
+                actor=actor,
+                import_secrets=import_secrets,
+                import_settings=import_settings,
+            )
+            for detection in detections
+        ]
+    finally:
         try:
-            # Some distributions may not accept db_path as a keyword argument.
-            store = keystore_cls(str(resolved_db))
-        except TypeError:
-            store = keystore_cls(db_path=str(resolved_db))
-    except Exception as exc:
-        return SquidStoreImportResult(
-            success=False,
-            db_path=resolved_db,
-            source_system=detection.system,
-            errors=[f"failed to initialize squid store: {exc}"],
-        )
+            store.close()
+        except Exception:
+            pass
+
 
+def _open_store(keystore_cls: type[Any], db_path: Path) -> Any:
     try:
-        if import_secrets:
-            for name, value in sorted((detection.secrets or {}).items()):
-                try:
-                    store.save_password(
-                        agent_id=target_agent_id,
-                        name=f"import.{detection.system}.{name}",
-                        password=str(value),
-                        metadata={
-                            "source_system": detection.system,
-                            "source_path": str(detection.config_path),
-                            "imported_by": actor,
-                            "kind": "secret",
-                        },
-                        actor=actor,
-                    )
-                    imported_secret_count += 1
-                except Exception as exc:
-                    errors.append(f"secret {name}: {exc}")
-
-        # Always store a settings payload record if requested, even if empty,
-        # so the import event is discoverable/auditable.
-        if import_settings:
-            payload = {
-                "source_system": detection.system,
-                "source_path": str(detection.config_path),
-                "model_settings": detection.model_settings,
-                "agent_settings": detection.agent_settings,
-            }
+        # Some distributions may not accept db_path as a keyword argument.
+        return keystore_cls(str(db_path))
+    except TypeError:
+        return keystore_cls(db_path=str(db_path))
+
+
+def _import_into_store(
+    store: Any,
+    detection: DetectionResult,
+    *,
+    db_path: Path,
+    target_agent_id: str,
+    actor: str,
+    import_secrets: bool,
+    import_settings: bool,
+) -> SquidStoreImportResult:
+    imported_secret_count = 0
+    imported_settings_count = 0
+    errors: List[str] = []
+
+    if import_secrets:
+        # Extraction already orders secrets by name; a hand-built
+        # DetectionResult is imported in its own order.
+        for name, value in detection.secrets.items():
             try:
                 store.save_password(
                     agent_id=target_agent_id,
-                    name=f"import.{detection.system}.settings",
-                    password=json.dumps(payload, ensure_ascii=True, sort_keys=True),
+                    name=f"import.{detection.system}.{name}",
+                    password=str(value),
                     metadata={
                         "source_system": detection.system,
                         "source_path": str(detection.config_path),
                         "imported_by": actor,
-                        "kind": "settings",
+                        "kind": "secret",
                     },
                     actor=actor,
                 )
-                imported_settings_count += 1
+                imported_secret_count += 1
             except Exception as exc:
-                errors.append(f"settings payload: {exc}")
-    finally:
+                errors.append(f"secret {name}: {exc}")
+
+    # Always store a settings payload record if requested, even if empty,
+    # so the import event is discoverable/auditable.
+    if import_settings:
+        payload = {
+            "source_system": detection.system,
+            "source_path": str(detection.config_path),
+            "model_settings": detection.model_settings,
+            "agent_settings": detection.agent_settings,
+        }
         try:
-            store.close()
-        except Exception:
-            pass
+            store.save_password(
+                agent_id=target_agent_id,
+                name=f"import.{detection.system}.settings",
+                password=json.dumps(payload, ensure_ascii=True, sort_keys=True),
+                metadata={
+                    "source_system": detection.system,
+                    "source_path": str(detection.config_path),
+                    "imported_by": actor,
+                    "kind": "settings",
+                },
+                actor=actor,
+            )
+            imported_settings_count += 1
+        except Exception as exc:
+            errors.append(f"settings payload: {exc}")
 
     return SquidStoreImportResult(
         success=len(errors) == 0,
-        db_path=resolved_db,
+        db_path=db_path,
         source_system=detection.system,
         imported_secret_count=imported_secret_count,
         imported_settings_count=imported_settings_count,
@@ -6,19 +6,31 @@ then bridges to Busy38's internal systems via the adapter.
 
 import asyncio
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.types import Receive, Scope, Send
 
 from .adapter import get_adapter, shutdown_adapter, Busy38Adapter
+from .client import _TERMINAL_MISSION_STATES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (busy-bridge[speedups])
+    orjson = None  # type: ignore[assignment]
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
 # Pydantic models
 class ToolUseRequest(BaseModel):
     description: str
@@ -51,15 +63,83 @@ class CheatcodeExecuteRequest(BaseModel):
     attributes: Dict[str, Any] = Field(default_factory=dict)
 
 
+class _CachedJSONBody:
+    """JSON response body rebuilt at most once per `ttl` seconds.
+
+    Abstraction justification: /tools is polled far more often than the tool
+    registry changes, and every poll re-encoded the same payload.
+    Concurrent misses wait on one rebuild instead of each calling the adapter.
+    The body is encoded like every other route response (see _encode_json), at
+    most `ttl` seconds old.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._body: Optional[bytes] = None
+        self._expires = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, build: Callable[[], Awaitable[Any]]) -> bytes:
+        body = self._body
+        if body is not None and time.monotonic() < self._expires:
+            return body
+        async with self._lock:
+            if self._body is not None and time.monotonic() < self._expires:
+                return self._body
+            body = _encode_json(await build())
+            self._body = body
+            self._expires = time.monotonic() + self._ttl
+            return body
+
+    def clear(self) -> None:
+        self._body = None
+
+
+_TOOLS_BODY = _CachedJSONBody(ttl=1.0)
+
+
+def _json_body_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _encode_json(content: Any) -> bytes:
+    """Encode a route result the way FastAPI's default response would.
+
+    Adapter payloads are already plain dicts and lists, so orjson serializes
+    them in one C pass instead of jsonable_encoder walking every value before
+    json.dumps. Anything orjson cannot represent natively goes through
+    jsonable_encoder (per value via `default`, or wholesale when orjson rejects
+    the document, e.g. integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=jsonable_encoder)
+        except TypeError:
+            pass
+    return bytes(JSONResponse(jsonable_encoder(content)).body)
+
+
+def _json_response(content: Any) -> Response:
+    return _json_body_response(_encode_json(content))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan."""
     logger.info("Starting Busy Bridge API server")
-    # Initialize adapter (connects to Busy38)
-    await get_adapter()
+    # Initialize adapter (connects to Busy38) once; routes read it from
+    # app.state instead of awaiting the locked accessor per request.
+    app.state.adapter = await get_adapter()
+    # ((id(adapter), mission_version, mission count), encoded body) of the
+    # last full /missions listing. Lives and dies with the adapter: a new
+    # adapter restarts mission_version, so a body from an older one must never
+    # match.
+    app.state.missions_body = None
     yield
     # Cleanup
     logger.info("Shutting down Busy Bridge API server")
+    app.state.adapter = None
+    app.state.missions_body = None
     await shutdown_adapter()
 
 
@@ -70,53 +150,108 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware. Only browser clients need it; deployments serving agents
+# and the CLI can set BUSY_BRIDGE_ENABLE_CORS=0 to take it out of every request.
+# Methods and headers are the ones this API and busy_bridge.client use.
+# BUSY_BRIDGE_CORS_ORIGINS narrows "*" to a comma-separated list; Starlette
+# builds the preflight headers once at startup and checks origins by set
+# membership, so a hand-rolled static preflight would buy nothing over it.
+if os.getenv("BUSY_BRIDGE_ENABLE_CORS", "1") == "1":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[
+            origin.strip()
+            for origin in os.getenv("BUSY_BRIDGE_CORS_ORIGINS", "*").split(",")
+            if origin.strip()
+        ],
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["authorization", "content-type", "x-agent-id"],
+    )
+
+
+class _GZipExceptEventStreams(GZipMiddleware):
+    """GZipMiddleware that passes `/events` SSE routes through untouched.
+
+    Only recent Starlette releases exclude text/event-stream themselves; older
+    ones (still allowed by the fastapi floor) buffer and compress the stream,
+    which would hold back every mission event.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/events"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Mission listings and details repeat the same keys per mission and compress
+# several-fold, which matters for remote pollers. Bodies under 512 bytes (most
+# single-tool and health responses) are sent as-is. BUSY_BRIDGE_ENABLE_GZIP=0
+# skips it for loopback-only deployments where the CPU is worth more than the
+# bytes.
+if os.getenv("BUSY_BRIDGE_ENABLE_GZIP", "1") == "1":
+    app.add_middleware(_GZipExceptEventStreams, minimum_size=512, compresslevel=5)
+
+
+async def get_busy_adapter(request: Request) -> Busy38Adapter:
+    """Get the Busy38 adapter initialized by the app lifespan."""
+    # async def: FastAPI would run a plain def dependency in its threadpool.
+    adapter: Optional[Busy38Adapter] = getattr(request.app.state, "adapter", None)
+    if adapter is None:
+        raise HTTPException(status_code=503, detail="Busy38 adapter is not initialized")
+    return adapter
 
 
-async def get_busy_adapter() -> Busy38Adapter:
-    """Get the Busy38 adapter."""
-    return await get_adapter()
+# Health endpoint
+# (unix second, encoded body). Liveness probes hit /health many times a second;
+# the body only changes when the whole-second timestamp does.
+_health_cache: Tuple[int, bytes] = (-1, b"")
 
 
-# Health endpoint
 @app.get("/health")
 async def health():
     """Health check."""
-    return {
-        "status": "healthy",
-        "version": "0.2.0",
-        "timestamp": datetime.utcnow().isoformat(),
-        "busy38_connected": True,
-    }
+    global _health_cache
+    now = int(time.time())
+    if _health_cache[0] != now:
+        body = bytes(
+            JSONResponse(
+                {
+                    "status": "healthy",
+                    "version": "0.2.0",
+                    # Naive UTC ISO 8601, as datetime.utcnow().isoformat() gave,
+                    # at whole-second resolution.
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)),
+                    "busy38_connected": True,
+                }
+            ).body
+        )
+        _health_cache = (now, body)
+    return _json_body_response(_health_cache[1])
 
 
 # Tool endpoints
 @app.get("/tools")
-async def list_tools():
+async def list_tools(adapter: Busy38Adapter = Depends(get_busy_adapter)):
     """List available tools."""
     try:
-        adapter = await get_busy_adapter()
-        tools = await adapter.list_tools()
-        return {"tools": tools}
+
+        async def build() -> Dict[str, Any]:
+            return {"tools": await adapter.list_tools()}
+
+        return _json_body_response(await _TOOLS_BODY.get(build))
     except Exception as e:
         logger.error(f"Failed to list tools: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/tools/{name}")
-async def lookup_tool(name: str):
+async def lookup_tool(name: str, adapter: Busy38Adapter = Depends(get_busy_adapter)):
     """Get tool details."""
     try:
-        adapter = await get_busy_adapter()
         tool = await adapter.lookup_tool(name)
-        return tool
+        return _json_response(tool)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -125,24 +260,22 @@ async def lookup_tool(name: str):
 
 
 @app.post("/tools/use")
-async def use_tool(request: ToolUseRequest):
+async def use_tool(request: ToolUseRequest, adapter: Busy38Adapter = Depends(get_busy_adapter)):
     """Execute a tool via plain English."""
     logger.info(f"Tool use request: {request.description}")
     try:
-        adapter = await get_busy_adapter()
         result = await adapter.use_tool(request.description)
-        return result
+        return _json_response(result)
     except Exception as e:
         logger.error(f"Failed to use tool: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/tools/make")
-async def make_tool(request: ToolMakeRequest):
+async def make_tool(request: ToolMakeRequest, adapter: Busy38Adapter = Depends(get_busy_adapter)):
     """Create a new tool via mission."""
     logger.info(f"Tool make request: {request.description}")
     try:
-        adapter = await get_busy_adapter()
         mission_id = await adapter.make_tool(request.description)
         return {
             "success": True,
@@ -156,22 +289,53 @@ async def make_tool(request: ToolMakeRequest):
 
 # Mission endpoints
 @app.get("/missions")
-async def list_missions():
-    """List all missions."""
+async def list_missions(
+    request: Request,
+    since_version: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1),
+    adapter: Busy38Adapter = Depends(get_busy_adapter),
+):
+    """List missions, optionally only those changed after `since_version`.
+
+    With `limit`, at most that many missions are returned and `version` is the
+    cursor to pass as `since_version` for the next page.
+    """
     try:
-        adapter = await get_busy_adapter()
-        missions = await adapter.list_missions()
-        return {"missions": missions}
+        if limit is not None:
+            missions, cursor = await adapter.list_missions_page(
+                since_version=since_version, limit=limit
+            )
+            return _json_response({"missions": missions, "version": cursor})
+        missions = await adapter.list_missions(since_version=since_version)
+        version = adapter.mission_version
+        if since_version:
+            # Incremental polls differ per caller and are already small.
+            return _json_response({"missions": missions, "version": version})
+        # The adapter bumps mission_version whenever any run's payload changes
+        # or a run appears; a removed run shrinks the count. An unchanged
+        # (adapter, version, count) therefore means an identical listing, so
+        # the encoded body is reused instead of re-encoding every mission.
+        state = request.app.state
+        key = (id(adapter), version, len(missions))
+        cached = getattr(state, "missions_body", None)
+        if cached is None or cached[0] != key:
+            cached = state.missions_body = (
+                key,
+                _encode_json({"missions": missions, "version": version}),
+            )
+        return _json_body_response(cached[1])
     except Exception as e:
         logger.error(f"Failed to list missions: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/missions")
-async def create_mission(request: MissionCreateRequest):
+async def create_mission(
+    request: MissionCreateRequest,
+    adapter: Busy38Adapter = Depends(get_busy_adapter),
+):
     """Create a new mission."""
     try:
-        adapter = await get_busy_adapter()
         mission_id = await adapter.start_mission(
             objective=request.objective,
             role=request.role,
@@ -190,12 +354,11 @@ async def create_mission(request: MissionCreateRequest):
 
 
 @app.get("/missions/{mission_id}")
-async def get_mission(mission_id: str):
+async def get_mission(mission_id: str, adapter: Busy38Adapter = Depends(get_busy_adapter)):
     """Get mission details."""
     try:
-        adapter = await get_busy_adapter()
         mission = await adapter.get_mission(mission_id)
-        return mission
+        return _json_response(mission)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -204,12 +367,11 @@ async def get_mission(mission_id: str):
 
 
 @app.get("/missions/{mission_id}/notes")
-async def get_mission_notes(mission_id: str):
+async def get_mission_notes(mission_id: str, adapter: Busy38Adapter = Depends(get_busy_adapter)):
     """Get notes for a mission."""
     try:
-        adapter = await get_busy_adapter()
         notes = await adapter.get_mission_notes(mission_id)
-        return {"notes": notes}
+        return _json_response({"notes": notes})
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -217,11 +379,84 @@ async def get_mission_notes(mission_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Seconds between in-process checks for a mission's event stream. Each check is
+# a cached adapter lookup, not an HTTP round trip, so it can be much tighter
+# than the client-side poll interval it replaces.
+_EVENT_POLL_INTERVAL = float(os.getenv("BUSY_BRIDGE_EVENT_POLL_INTERVAL", "0.5"))
+
+
+def _sse_error(detail: str) -> bytes:
+    return b"event: error\ndata: " + _encode_json({"detail": detail}) + b"\n\n"
+
+
+@app.get("/missions/{mission_id}/events")
+async def mission_events(
+    mission_id: str,
+    request: Request,
+    adapter: Busy38Adapter = Depends(get_busy_adapter),
+) -> StreamingResponse:
+    """Stream mission updates as Server-Sent Events until a terminal state.
+
+    Each `mission` event carries the same `{"mission", "notes"}` snapshot that a
+    poll of the detail and notes endpoints would, and is sent only when that
+    snapshot changes; the stream closes after the terminal snapshot.
+    """
+    try:
+        mission = await adapter.get_mission(mission_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to stream mission events: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def events() -> AsyncIterator[bytes]:
+        nonlocal mission
+        last_body = None
+        while True:
+            # The 200 and SSE headers are already sent, so failures can no
+            # longer become an HTTP error; report them as a final `error` event
+            # instead of aborting the connection.
+            try:
+                notes = await adapter.get_mission_notes(mission_id)
+                body = _encode_json({"mission": mission, "notes": notes})
+            except Exception as e:
+                logger.error(f"Mission event stream failed for {mission_id}: {e}")
+                yield _sse_error(str(e))
+                return
+            if body != last_body:
+                last_body = body
+                yield b"event: mission\ndata: " + body + b"\n\n"
+            if mission.get("state") in _TERMINAL_MISSION_STATES:
+                return
+            await asyncio.sleep(_EVENT_POLL_INTERVAL)
+            if await request.is_disconnected():
+                return
+            try:
+                mission = await adapter.get_mission(mission_id)
+            except ValueError as e:
+                # The run was dropped from Busy while the stream was open.
+                yield _sse_error(str(e))
+                return
+            except Exception as e:
+                logger.error(f"Mission event stream failed for {mission_id}: {e}")
+                yield _sse_error(str(e))
+                return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @app.post("/missions/{mission_id}/cancel")
-async def cancel_mission(mission_id: str, request: MissionCancelRequest):
+async def cancel_mission(
+    mission_id: str,
+    request: MissionCancelRequest,
+    adapter: Busy38Adapter = Depends(get_busy_adapter),
+):
     """Cancel a mission."""
     try:
-        adapter = await get_busy_adapter()
         success = await adapter.cancel_mission(mission_id, request.reason)
         if success:
             return {"success": True, "message": "Mission cancelled"}
@@ -235,10 +470,13 @@ async def cancel_mission(mission_id: str, request: MissionCancelRequest):
 
 
 @app.post("/missions/{mission_id}/respond")
-async def respond_to_mission(mission_id: str, request: MissionRespondRequest):
+async def respond_to_mission(
+    mission_id: str,
+    request: MissionRespondRequest,
+    adapter: Busy38Adapter = Depends(get_busy_adapter),
+):
     """Respond to a mission query."""
     try:
-        adapter = await get_busy_adapter()
         success = await adapter.respond_to_mission(mission_id, request.response)
         if success:
             return {"success": True, "message": "Response recorded"}
@@ -253,15 +491,17 @@ async def respond_to_mission(mission_id: str, request: MissionRespondRequest):
 
 # Cheatcode endpoints
 @app.post("/cheatcodes/execute")
-async def execute_cheatcode(request: CheatcodeExecuteRequest):
+async def execute_cheatcode(
+    request: CheatcodeExecuteRequest,
+    adapter: Busy38Adapter = Depends(get_busy_adapter),
+):
     """Execute a cheatcode."""
     logger.info(f"Cheatcode: {request.namespace}:{request.action}")
     try:
-        adapter = await get_busy_adapter()
         result = await adapter.execute_cheatcode(
             request.namespace, request.action, request.attributes
         )
-        return result
+        return _json_response(result)
     except Exception as e:
         logger.error(f"Failed to execute cheatcode: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -270,7 +510,18 @@ async def execute_cheatcode(request: CheatcodeExecuteRequest):
 def start_server(host: str = "0.0.0.0", port: int = 8080):
     """Start the API server."""
     import uvicorn
-    uvicorn.run(app, host=host, port=port)
+
+    # uvicorn's default loop="auto"/http="auto" already choose uvloop and
+    # httptools when they are installed (the `speedups` extra) and fall back to
+    # asyncio and h11 otherwise, so they are not forced here. The per-request
+    # access log is off unless BUSY_BRIDGE_ACCESS_LOG=1; route errors are still
+    # logged.
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        access_log=os.getenv("BUSY_BRIDGE_ACCESS_LOG", "0") == "1",
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+#!/usr/bin/env bash
+# Build self-contained CLI artifacts in dist/:
+#   dist/busy-bridge.pyz   zipapp with busy_bridge and its dependencies
+#   dist/busy-bridge/      PyInstaller one-dir build (only if pyinstaller is installed)
+#
+# Both replace the per-module sys.path walk of a venv console script with reads
+# from a single archive/directory. Compiled extensions (pydantic-core, used by
+# the server only) cannot be imported from a zipapp; use the one-dir build or
+# the regular install for `busy-bridge server`.
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$ROOT"
+
+PYTHON="${PYTHON:-python3}"
+DIST="$ROOT/dist"
+STAGE="$(mktemp -d)"
+trap 'rm -rf "$STAGE"' EXIT
+
+mkdir -p "$DIST"
+
+"$PYTHON" -m pip install -q --target "$STAGE" .
+"$PYTHON" -m compileall -q "$STAGE"
+"$PYTHON" -m zipapp "$STAGE" \
+  -p "/usr/bin/env python3" \
+  -m "busy_bridge.__main__:main" \
+  -o "$DIST/busy-bridge.pyz"
+echo "Built $DIST/busy-bridge.pyz"
+
+if "$PYTHON" -m PyInstaller --version >/dev/null 2>&1; then
+  "$PYTHON" -m PyInstaller --noconfirm --onedir \
+    --name busy-bridge \
+    --distpath "$DIST" \
+    --workpath "$STAGE/pyinstaller-build" \
+    --specpath "$STAGE" \
+    --collect-submodules busy_bridge.cli_cmds \
+    "$ROOT/busy_bridge/__main__.py"
+  echo "Built $DIST/busy-bridge/"
+else
+  echo "PyInstaller not installed; skipped one-dir build (pip install pyinstaller)."
+fi
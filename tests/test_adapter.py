@@ -0,0 +1,562 @@
+import asyncio
+import subprocess
+import sys
+import threading
+import types
+from datetime import datetime
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from busy_bridge import adapter as adapter_mod
+
+
+class FakeState(Enum):
+    RUNNING = "running"
+    APPROVED = "approved"
+
+
+class FakeMissionSpec:
+    _counter = 0
+
+    def __init__(
+        self, objective, role, acceptance_criteria=None, allowed_namespaces=None, max_steps=6
+    ):
+        FakeMissionSpec._counter += 1
+        self.mission_id = f"m{FakeMissionSpec._counter}"
+        self.objective = objective
+        self.role = role
+        self.acceptance_criteria = acceptance_criteria or []
+        self.allowed_namespaces = allowed_namespaces or []
+        self.max_steps = max_steps
+
+
+class FakeNotes:
+    def __init__(self):
+        self.posted = []
+
+    def post_structured_note(self, **kwargs):
+        self.posted.append(kwargs)
+
+    def get_mission_notes(self, mission_id):
+        return [
+            SimpleNamespace(
+                category="query",
+                title="Question",
+                author_id="agent",
+                metadata={"payload": {"text": "hi"}},
+                created_at=datetime(2026, 1, 1, 12, 0, 0),
+            )
+        ]
+
+
+class FakeMissions:
+    def __init__(self):
+        self.runs = {}
+        self.notes = FakeNotes()
+
+    def start_mission(self, spec):
+        run = SimpleNamespace(
+            spec=spec,
+            state=FakeState.RUNNING,
+            created_at=datetime(2026, 1, 1, 12, 0, 0),
+            started_at=None,
+            completed_at=None,
+            final_output=None,
+            error=None,
+            steps=[],
+            cancel_reason=None,
+            cancelled_by=None,
+        )
+        self.runs[spec.mission_id] = run
+        return run
+
+    def list_runs(self):
+        return list(self.runs.values())
+
+    def get_run(self, mission_id):
+        return self.runs.get(mission_id)
+
+    def cancel_mission(self, mission_id, reason, cancelled_by):
+        run = self.runs.get(mission_id)
+        if run is None:
+            return False
+        run.cancel_reason = reason
+        run.cancelled_by = cancelled_by
+        return True
+
+
+class FakeOrchestrator:
+    starts = 0
+
+    def __init__(self, config):
+        self.config = config
+        self.missions = FakeMissions()
+
+    async def start(self):
+        FakeOrchestrator.starts += 1
+        # Yield so concurrent get_adapter() callers interleave with startup.
+        await asyncio.sleep(0)
+
+    async def stop(self):
+        return None
+
+    async def run_agent_loop(self, prompt):
+        return f"ran: {prompt}"
+
+
+class FakeToolManager:
+    def __init__(self, tools_dir):
+        self.tools_dir = tools_dir
+        self._tools = {}
+
+    def load_all(self):
+        self._tools = {
+            "read_file": {"name": "read_file", "description": "Read a file"},
+        }
+
+
+class FakeRegistry:
+    def execute(self, namespace, action, attributes):
+        if namespace == "bad":
+            raise RuntimeError("boom")
+        return {"namespace": namespace, "action": action, "attributes": attributes}
+
+
+@pytest.fixture
+def fake_busy(tmp_path, monkeypatch):
+    probe = tmp_path / "core" / "orchestration" / "integration.py"
+    probe.parent.mkdir(parents=True)
+    probe.write_text("", encoding="utf-8")
+    monkeypatch.setenv("BUSY38_SOURCE_PATH", str(tmp_path))
+
+    integration = types.ModuleType("core.orchestration.integration")
+    integration.Busy38Orchestrator = FakeOrchestrator
+    integration.OrchestratorConfig = lambda: {}
+    registry = types.ModuleType("core.cheatcodes.registry")
+    registry.cheatcode_registry = FakeRegistry()
+    mission = types.ModuleType("core.mission")
+    mission.MissionSpec = FakeMissionSpec
+    tools = types.ModuleType("core.tools.manager")
+    tools.ToolManager = FakeToolManager
+    for mod in (integration, registry, mission, tools):
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+
+    FakeOrchestrator.starts = 0
+    yield tmp_path
+    src = str(tmp_path.resolve())
+    if src in sys.path:
+        sys.path.remove(src)
+
+
+def test_cached_import_prefers_sys_modules(monkeypatch):
+    fake = types.ModuleType("core.fake_cached")
+    fake.marker = object()
+    monkeypatch.setitem(sys.modules, "core.fake_cached", fake)
+
+    def fail_import(name):
+        raise AssertionError(f"import_module should not be called for {name}")
+
+    monkeypatch.setattr(adapter_mod.importlib, "import_module", fail_import)
+    assert adapter_mod._cached_import("core.fake_cached", "marker") is fake.marker
+
+
+def test_cached_import_falls_back_to_import_module(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    rgb_to_hsv = adapter_mod._cached_import("colorsys", "rgb_to_hsv")
+    assert rgb_to_hsv is sys.modules["colorsys"].rgb_to_hsv
+
+
+def test_adapter_import_does_not_load_busy_core():
+    code = (
+        "import sys, busy_bridge.adapter\n"
+        "loaded = [m for m in sys.modules if m == 'core' or m.startswith('core.')]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_public_methods_initialize_once(fake_busy, monkeypatch):
+    calls = []
+    real_initialize = adapter_mod.Busy38Adapter.initialize
+
+    async def counting_initialize(self):
+        calls.append(1)
+        await real_initialize(self)
+
+    monkeypatch.setattr(adapter_mod.Busy38Adapter, "initialize", counting_initialize)
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        await adapter.list_tools()
+        await adapter.list_tools()
+        await adapter.lookup_tool("read_file")
+
+    asyncio.run(scenario())
+    assert calls == [1]
+    assert FakeOrchestrator.starts == 1
+
+
+def test_resolve_busy_source_path_is_memoized(fake_busy, monkeypatch):
+    monkeypatch.setattr(adapter_mod, "_busy_source_hits", {})
+    first = adapter_mod.Busy38Adapter()._resolve_busy_source_path()
+    assert first == fake_busy.resolve()
+
+    def fail_isfile(path):
+        raise AssertionError("filesystem should not be re-probed")
+
+    monkeypatch.setattr(adapter_mod.os.path, "isfile", fail_isfile)
+    assert adapter_mod.Busy38Adapter()._resolve_busy_source_path() == first
+
+
+def test_get_adapter_concurrent_first_calls_start_once(fake_busy, monkeypatch):
+    monkeypatch.setattr(adapter_mod, "_adapter", None)
+    monkeypatch.setattr(adapter_mod, "_adapter_lock", asyncio.Lock())
+
+    async def scenario():
+        return await asyncio.gather(*(adapter_mod.get_adapter() for _ in range(5)))
+
+    adapters = asyncio.run(scenario())
+    assert all(a is adapters[0] for a in adapters)
+    assert FakeOrchestrator.starts == 1
+
+
+def test_list_tools_payload(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+    tools = asyncio.run(adapter.list_tools())
+    assert tools == [{"name": "read_file", "description": "Read a file", "category": "general"}]
+
+
+def test_serialize_mission_run_reuses_payload_until_run_changes(fake_busy, monkeypatch):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        mission_id = await adapter.start_mission("build docs")
+        builds = []
+        real_build = adapter_mod.Busy38Adapter._build_mission_run_payload
+
+        def counting_build(self, run):
+            builds.append(run.spec.mission_id)
+            return real_build(self, run)
+
+        monkeypatch.setattr(adapter_mod.Busy38Adapter, "_build_mission_run_payload", counting_build)
+        first = await adapter.list_missions()
+        second = await adapter.list_missions()
+        assert first == second
+        assert len(builds) == 1
+
+        run = adapter.orchestrator.missions.get_run(mission_id)
+        run.steps.append(
+            SimpleNamespace(index=0, description="write", status="running", output=None)
+        )
+        third = await adapter.list_missions()
+        assert len(builds) == 2
+        assert third[0]["steps"][0]["status"] == "running"
+
+        run.steps[0].status = "completed"
+        fourth = await adapter.get_mission(mission_id)
+        assert fourth["steps"][0]["status"] == "completed"
+
+        await adapter.cancel_mission(mission_id, "stop")
+        fifth = await adapter.get_mission(mission_id)
+        assert fifth["cancel_reason"] == "stop"
+
+    asyncio.run(scenario())
+
+
+def test_get_mission_notes_serializes_full_and_partial_notes(fake_busy, monkeypatch):
+    partial = SimpleNamespace(title="Partial", metadata=None, created_at=None)
+    full = FakeNotes().get_mission_notes("m")[0]
+    monkeypatch.setattr(FakeNotes, "get_mission_notes", lambda self, _id: [full, partial])
+    adapter = adapter_mod.Busy38Adapter()
+
+    notes = asyncio.run(adapter.get_mission_notes("m1"))
+    assert notes[0] == {
+        "category": "query",
+        "title": "Question",
+        "author_id": "agent",
+        "payload": {"text": "hi"},
+        "timestamp": "2026-01-01T12:00:00",
+    }
+    assert notes[1]["category"] == "unknown"
+    assert notes[1]["title"] == "Partial"
+    assert notes[1]["author_id"] == ""
+    assert notes[1]["payload"] == {}
+    assert datetime.fromisoformat(notes[1]["timestamp"]).tzinfo is None
+
+
+def test_get_mission_notes_shares_one_fallback_timestamp(fake_busy, monkeypatch):
+    undated = [SimpleNamespace(title=f"n{i}", metadata=None, created_at=None) for i in range(3)]
+    monkeypatch.setattr(FakeNotes, "get_mission_notes", lambda self, _id: undated)
+    adapter = adapter_mod.Busy38Adapter()
+
+    notes = asyncio.run(adapter.get_mission_notes("m1"))
+    assert len({note["timestamp"] for note in notes}) == 1
+
+
+def test_initialize_loads_tools_off_event_loop_thread(fake_busy, monkeypatch):
+    load_threads = []
+    real_load_all = FakeToolManager.load_all
+
+    def recording_load_all(self):
+        load_threads.append(threading.get_ident())
+        real_load_all(self)
+
+    monkeypatch.setattr(FakeToolManager, "load_all", recording_load_all)
+    adapter = adapter_mod.Busy38Adapter()
+    asyncio.run(adapter.initialize())
+    assert load_threads and load_threads[0] != threading.get_ident()
+    assert "read_file" in adapter.tool_manager._tools
+
+
+def test_notes_api_is_resolved_once_at_initialize(fake_busy, monkeypatch):
+    monkeypatch.delattr(FakeNotes, "get_mission_notes")
+    monkeypatch.delattr(FakeNotes, "post_structured_note")
+    monkeypatch.setattr(FakeNotes, "get_notes_for_context", lambda self, _id: [], raising=False)
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        mission_id = await adapter.start_mission("audit")
+        assert await adapter.get_mission_notes(mission_id) == []
+        with pytest.raises(RuntimeError, match="structured mission responses"):
+            await adapter.respond_to_mission(mission_id, "go")
+
+    asyncio.run(scenario())
+    assert adapter._get_notes is not None
+    assert adapter._post_note is None
+
+
+def test_respond_to_mission_posts_structured_note(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        mission_id = await adapter.start_mission("audit")
+        assert await adapter.respond_to_mission(mission_id, "use duckdb") is True
+        return mission_id
+
+    mission_id = asyncio.run(scenario())
+    posted = adapter.orchestrator.missions.notes.posted
+    assert posted[0]["recipient_id"] == mission_id
+    assert posted[0]["payload"] == {"response": "use duckdb"}
+
+
+def test_busy_checkout_is_put_on_sys_path_once(fake_busy, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    adapter_mod.Busy38Adapter()._ensure_busy_imports()
+    adapter_mod.Busy38Adapter()._ensure_busy_imports()
+    assert sys.path[0] == str(fake_busy.resolve())
+    assert sys.path.count(str(fake_busy.resolve())) == 1
+
+
+def test_adapter_has_no_instance_dict():
+    adapter = adapter_mod.Busy38Adapter()
+    assert not hasattr(adapter, "__dict__")
+
+
+def test_state_serializer_respecializes_when_state_type_changes(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        mission_id = await adapter.start_mission("audit")
+        assert (await adapter.get_mission(mission_id))["state"] == "running"
+        adapter.orchestrator.missions.get_run(mission_id).state = "approved"
+        assert (await adapter.get_mission(mission_id))["state"] == "approved"
+        adapter.orchestrator.missions.get_run(mission_id).state = FakeState.APPROVED
+        assert (await adapter.get_mission(mission_id))["state"] == "approved"
+
+    asyncio.run(scenario())
+
+
+def test_resolve_busy_source_path_reprobes_after_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(adapter_mod, "_busy_source_hits", {})
+    checkout = tmp_path / "busy"
+    checkout.mkdir()
+    assert adapter_mod._resolve_busy_source_path_cached(str(checkout), str(checkout)) is None
+
+    probe = checkout / "core" / "orchestration" / "integration.py"
+    probe.parent.mkdir(parents=True)
+    probe.write_text("", encoding="utf-8")
+    found = adapter_mod._resolve_busy_source_path_cached(str(checkout), str(checkout))
+    assert found == str(checkout.resolve())
+
+
+def test_use_and_make_tool_prompts(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        used = await adapter.use_tool("read README")
+        mission_id = await adapter.make_tool("fetch RSS")
+        return used, mission_id
+
+    used, mission_id = asyncio.run(scenario())
+    assert used["result"] == "ran: Use a tool to: read README"
+    run = adapter.orchestrator.missions.get_run(mission_id)
+    assert run.spec.objective == "Create a tool that: fetch RSS"
+    assert run.spec.role == "tool_builder_agent"
+
+
+def test_list_tools_reflects_registry_changes(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        first = await adapter.list_tools()
+        assert [t["name"] for t in first] == ["read_file"]
+        first[0]["name"] = "mutated"
+        assert [t["name"] for t in await adapter.list_tools()] == ["read_file"]
+
+        tools = adapter.tool_manager._tools
+        tools["read_file"] = {"name": "read_file", "description": "Replaced in place"}
+        assert (await adapter.list_tools())[0]["description"] == "Replaced in place"
+
+        tools["rss"] = {"name": "rss", "description": "RSS reader"}
+        names = [t["name"] for t in await adapter.list_tools()]
+        assert names == ["read_file", "rss"]
+
+    asyncio.run(scenario())
+
+
+def test_returned_mission_payloads_do_not_share_cached_containers(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        mission_id = await adapter.start_mission("audit", acceptance_criteria=["tests pass"])
+        run = adapter.orchestrator.missions.get_run(mission_id)
+        run.steps.append(
+            SimpleNamespace(index=0, description="write", status="running", output=None)
+        )
+
+        got = await adapter.get_mission(mission_id)
+        got["steps"][0]["status"] = "mutated"
+        got["steps"].append({})
+        got["acceptance_criteria"].append("mutated")
+        listed = (await adapter.list_missions())[0]
+        listed["steps"].clear()
+
+        again = await adapter.get_mission(mission_id)
+        assert again["steps"] == [
+            {"index": 0, "description": "write", "status": "running", "output": None}
+        ]
+        assert again["acceptance_criteria"] == ["tests pass"]
+        assert run.spec.acceptance_criteria == ["tests pass"]
+
+    asyncio.run(scenario())
+
+
+def test_list_missions_since_version_returns_only_changed_runs(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        first_id = await adapter.start_mission("one")
+        second_id = await adapter.start_mission("two")
+        full = await adapter.list_missions()
+        assert {m["mission_id"] for m in full} == {first_id, second_id}
+        version = adapter.mission_version
+
+        assert await adapter.list_missions(since_version=version) == []
+
+        adapter.orchestrator.missions.get_run(second_id).state = FakeState.APPROVED
+        changed = await adapter.list_missions(since_version=version)
+        assert [m["mission_id"] for m in changed] == [second_id]
+        assert changed[0]["state"] == "approved"
+        assert adapter.mission_version > version
+
+    asyncio.run(scenario())
+
+
+def test_list_missions_page_resumes_from_its_cursor(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        ids = [await adapter.start_mission(f"m{i}") for i in range(3)]
+        await adapter.list_missions()
+        # Change the first run last so it sorts after the others.
+        adapter.orchestrator.missions.get_run(ids[0]).state = FakeState.APPROVED
+
+        page, cursor = await adapter.list_missions_page(limit=2)
+        assert [m["mission_id"] for m in page] == [ids[1], ids[2]]
+        rest, final = await adapter.list_missions_page(since_version=cursor, limit=2)
+        assert [m["mission_id"] for m in rest] == [ids[0]]
+        assert final == adapter.mission_version
+        assert await adapter.list_missions_page(since_version=final, limit=2) == ([], final)
+
+    asyncio.run(scenario())
+
+
+def test_execute_cheatcode_success_and_failure(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        ok = await adapter.execute_cheatcode("rw4", "read_file", {"path": "README.md"})
+        failed = await adapter.execute_cheatcode("bad", "explode", {})
+        return ok, failed
+
+    ok, failed = asyncio.run(scenario())
+    assert ok == {
+        "success": True,
+        "result": {"namespace": "rw4", "action": "read_file", "attributes": {"path": "README.md"}},
+    }
+    assert failed == {"success": False, "error": "boom"}
+
+
+def test_execute_cheatcode_runs_off_the_event_loop(fake_busy, monkeypatch):
+    import threading
+
+    adapter = adapter_mod.Busy38Adapter()
+    threads = []
+
+    async def scenario():
+        await adapter.initialize()
+        monkeypatch.setattr(
+            adapter, "_exec_cheatcode", lambda *args: threads.append(threading.get_ident())
+        )
+        await adapter.execute_cheatcode("rw4", "read_file", {})
+
+    asyncio.run(scenario())
+    assert threads and threads[0] != threading.get_ident()
+
+
+def test_execute_cheatcode_runs_one_cheatcode_at_a_time(fake_busy, monkeypatch):
+    import threading
+    import time
+
+    adapter = adapter_mod.Busy38Adapter()
+    active = []
+    overlap = []
+    guard = threading.Lock()
+
+    def slow_execute(namespace, action, attributes):
+        with guard:
+            active.append(action)
+            overlap.append(len(active))
+        time.sleep(0.01)
+        with guard:
+            active.remove(action)
+        return action
+
+    async def scenario():
+        await adapter.initialize()
+        monkeypatch.setattr(adapter, "_exec_cheatcode", slow_execute)
+        return await asyncio.gather(
+            *(adapter.execute_cheatcode("rw4", f"a{i}", {}) for i in range(4))
+        )
+
+    results = asyncio.run(scenario())
+    assert [r["result"] for r in results] == ["a0", "a1", "a2", "a3"]
+    assert max(overlap) == 1
+
+
+def test_list_missions_prunes_cache_entries_for_dropped_runs(fake_busy):
+    adapter = adapter_mod.Busy38Adapter()
+
+    async def scenario():
+        kept = await adapter.start_mission("keep")
+        dropped = await adapter.start_mission("drop")
+        await adapter.list_missions()
+        assert set(adapter._serialize_cache) == {kept, dropped}
+
+        del adapter.orchestrator.missions.runs[dropped]
+        assert [m["mission_id"] for m in await adapter.list_missions()] == [kept]
+        assert set(adapter._serialize_cache) == {kept}
+
+    asyncio.run(scenario())
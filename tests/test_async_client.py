@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pytest
+
+from busy_bridge.client import AsyncBusy38Client, Busy38Error
+from busy_bridge.config import Config
+
+
+def _make_client(handler):
+    client = AsyncBusy38Client(Config(url="http://busy.test", api_key="k"))
+    client.client = httpx.AsyncClient(
+        base_url="http://busy.test",
+        headers=client.client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_async_client_gathers_independent_requests():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers.get("Authorization")))
+        mission_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"mission_id": mission_id, "state": "running"})
+
+    async def run():
+        async with _make_client(handler) as client:
+            return await asyncio.gather(*(client.get_mission(m) for m in ("a", "b", "c")))
+
+    results = asyncio.run(run())
+    assert [r["mission_id"] for r in results] == ["a", "b", "c"]
+    assert sorted(seen) == [
+        ("/missions/a", "Bearer k"),
+        ("/missions/b", "Bearer k"),
+        ("/missions/c", "Bearer k"),
+    ]
+
+
+def test_async_client_translates_http_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"detail": "missing"})
+
+    async def run():
+        async with _make_client(handler) as client:
+            await client.get_mission("nope")
+
+    with pytest.raises(Busy38Error) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.details == {"detail": "missing"}
+
+
+def test_async_stream_mission_stops_at_terminal_state(monkeypatch):
+    states = iter(["pending", "approved"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/notes"):
+            return httpx.Response(200, json={"notes": []})
+        return httpx.Response(200, json={"mission_id": "m1", "state": next(states)})
+
+    async def run():
+        async with _make_client(handler) as client:
+            return [u async for u in client.stream_mission("m1", poll_interval=0.0)]
+
+    updates = asyncio.run(run())
+    assert [u["mission"]["state"] for u in updates] == ["pending", "approved"]
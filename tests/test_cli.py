@@ -0,0 +1,366 @@
+import subprocess
+import sys
+
+
+def _modules_loaded_after(code: str, names):
+    probe = (
+        f"{code}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {list(names)!r} if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+    return [m for m in out.stdout.strip().split(",") if m]
+
+
+def test_cli_import_defers_client_config_and_formatters():
+    loaded = _modules_loaded_after(
+        "import busy_bridge.cli",
+        [
+            "busy_bridge.client",
+            "busy_bridge.config",
+            "busy_bridge.formatters",
+            "busy_bridge.import_settings",
+            "httpx",
+            "yaml",
+            "rich.console",
+        ],
+    )
+    assert loaded == []
+
+
+def test_lazy_group_imports_only_the_invoked_command_module():
+    loaded = _modules_loaded_after(
+        "from click.testing import CliRunner\n"
+        "from busy_bridge.cli import cli\n"
+        "CliRunner().invoke(cli, ['tool', '--help'])",
+        [
+            "busy_bridge.cli_cmds.tool",
+            "busy_bridge.cli_cmds.mission",
+            "busy_bridge.cli_cmds.settings",
+            "busy_bridge.cli_cmds.server",
+        ],
+    )
+    assert loaded == ["busy_bridge.cli_cmds.tool"]
+
+
+def test_lazy_group_rejects_unknown_command():
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+
+    result = CliRunner().invoke(cli, ["nope"])
+    assert result.exit_code != 0
+    assert "No such command" in result.output
+
+
+def test_settings_show_prints_config_summary(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+
+    from busy_bridge import cli as cli_mod
+    from busy_bridge import formatters
+    from busy_bridge.cli import cli
+
+    # Wide enough that Rich does not wrap the long tmp_path.
+    monkeypatch.setenv("COLUMNS", "500")
+    cli_mod._console.cache_clear()
+    formatters._console.cache_clear()
+
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text(
+        "url: http://busy.example:9000\nagent_id: kat\ntimeout: 5\nimported_from: openclaw\n",
+        encoding="utf-8",
+    )
+    result = CliRunner().invoke(cli, ["--config", str(cfg_file), "settings", "show"])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0] == f"Config file: {cfg_file.resolve()}"
+    assert "Busy URL: http://busy.example:9000" in lines
+    assert "Agent ID: kat" in lines
+    assert "Timeout: 5" in lines
+    assert "Imported from: openclaw" in lines
+    assert not any(line.startswith("Imported at:") for line in lines)
+
+
+def test_relative_config_path_follows_the_current_directory(monkeypatch, tmp_path):
+    import json
+
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+
+    shown = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "bridge.yaml").write_text(f"agent_id: {name}\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path / name)
+        result = CliRunner().invoke(cli, ["--config", "bridge.yaml", "--json", "settings", "show"])
+        assert result.exit_code == 0, result.output
+        shown.append(json.loads(result.output))
+
+    assert [s["agent_id"] for s in shown] == ["a", "b"]
+    assert shown[1]["config_path"] == str((tmp_path / "b" / "bridge.yaml").resolve())
+
+
+def test_busy38_error_from_any_command_exits_with_message(monkeypatch, tmp_path):
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+    from busy_bridge.client import Busy38Client, Busy38Error
+
+    def fail(self):
+        raise Busy38Error("connection refused")
+
+    monkeypatch.setattr(Busy38Client, "list_missions", fail)
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["--config", str(cfg_file), "mission", "list"])
+    assert result.exit_code == 1
+    assert "Error: connection refused" in result.output
+
+
+def test_maybe_status_spins_only_on_interactive_terminal(monkeypatch):
+    import io
+    from contextlib import nullcontext
+
+    from busy_bridge import cli as cli_mod
+
+    started = []
+
+    class FakeConsole:
+        def status(self, message):
+            started.append(message)
+            return nullcontext()
+
+    class Tty(io.StringIO):
+        def isatty(self):
+            return True
+
+    monkeypatch.setattr(cli_mod, "console", FakeConsole())
+    monkeypatch.delenv("BUSY_NO_SPINNER", raising=False)
+
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    with cli_mod._maybe_status("piped"):
+        pass
+
+    monkeypatch.setattr(sys, "stdout", Tty())
+    with cli_mod._maybe_status("tty"):
+        pass
+
+    monkeypatch.setenv("BUSY_NO_SPINNER", "1")
+    with cli_mod._maybe_status("disabled"):
+        pass
+
+    assert started == ["tty"]
+
+
+def test_cheatcode_use_parses_namespace_and_params(monkeypatch, tmp_path):
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+    from busy_bridge.client import Busy38Client
+
+    calls = []
+
+    def fake_use_cheatcode(self, namespace, action, **attributes):
+        calls.append((namespace, action, attributes))
+        return {"success": True, "result": "ok"}
+
+    monkeypatch.setattr(Busy38Client, "use_cheatcode", fake_use_cheatcode)
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli,
+        ["--config", str(cfg_file), "cheatcode", "use", "rw4:read:file", "-p", "path=a=b"],
+    )
+    assert result.exit_code == 0, result.output
+    assert calls == [("rw4", "read:file", {"path": "a=b"})]
+
+    bad = runner.invoke(cli, ["--config", str(cfg_file), "cheatcode", "use", "rw4", "-p", "x=1"])
+    assert bad.exit_code == 1
+    assert "namespace:action" in bad.output
+
+
+def test_top_level_help_lists_commands_without_importing_them():
+    loaded = _modules_loaded_after(
+        "from click.testing import CliRunner\n"
+        "from busy_bridge.cli import cli\n"
+        "CliRunner().invoke(cli, ['--help'])",
+        [
+            "busy_bridge.cli_cmds.cheatcode",
+            "busy_bridge.cli_cmds.health",
+            "busy_bridge.cli_cmds.mission",
+            "busy_bridge.cli_cmds.server",
+            "busy_bridge.cli_cmds.settings",
+            "busy_bridge.cli_cmds.shortcuts",
+            "busy_bridge.cli_cmds.tool",
+        ],
+    )
+    assert loaded == []
+
+
+def test_static_short_help_matches_command_docstrings():
+    import click
+
+    from busy_bridge.cli import _LAZY_COMMANDS, cli
+
+    ctx = click.Context(cli)
+    for name, (_, short_help) in _LAZY_COMMANDS.items():
+        cmd = cli.get_command(ctx, name)
+        assert cmd.get_short_help_str(limit=200) == short_help, name
+
+
+def test_entry_point_fast_paths_skip_click():
+    for flag in ("--help", "--version"):
+        loaded = _modules_loaded_after(
+            "import contextlib, io, sys\n"
+            f"sys.argv = ['busy-bridge', {flag!r}]\n"
+            "from busy_bridge.__main__ import main\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    main()",
+            ["click", "rich", "busy_bridge.cli"],
+        )
+        assert loaded == [], flag
+
+
+def test_entry_point_static_output_matches_click():
+    from click.testing import CliRunner
+
+    from busy_bridge import __main__ as entry
+    from busy_bridge.cli import cli
+
+    runner = CliRunner()
+    help_out = runner.invoke(cli, ["--help"], prog_name="busy-bridge").output
+    version_out = runner.invoke(cli, ["--version"], prog_name="busy-bridge").output
+    assert help_out == entry._STATIC_HELP
+    assert version_out == f"busy-bridge, version {entry.__version__}\n"
+
+
+def test_server_command_without_extra_reports_install_hint(monkeypatch):
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+
+    for name in ("busy_bridge.cli_cmds.server", "busy_bridge.server"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.setitem(sys.modules, "fastapi", None)
+
+    result = CliRunner().invoke(cli, ["server"])
+    assert result.exit_code == 2
+    assert "No such command 'server'" in result.output
+    assert "busy-bridge[server]" in result.output
+
+
+def test_server_command_reraises_unrelated_import_errors(monkeypatch):
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+
+    for name in ("busy_bridge.cli_cmds.server", "busy_bridge.server"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    # A missing module that the extra does not provide is a bug, not a hint.
+    monkeypatch.setitem(sys.modules, "busy_bridge.server", None)
+
+    result = CliRunner().invoke(cli, ["server"])
+    assert isinstance(result.exception, ModuleNotFoundError)
+    assert "busy-bridge[server]" not in result.output
+
+
+def test_formatters_import_defers_rich():
+    loaded = _modules_loaded_after(
+        "import busy_bridge.formatters",
+        ["rich.console", "rich.table", "rich.panel", "rich.text", "rich.tree"],
+    )
+    assert loaded == []
+
+
+def test_json_flag_prints_raw_response_without_a_console(monkeypatch, tmp_path):
+    import json
+
+    from click.testing import CliRunner
+
+    from busy_bridge import cli as cli_mod
+    from busy_bridge import formatters
+    from busy_bridge.client import Busy38Client
+
+    missions = [{"mission_id": "m1", "state": "running", "objective": "ünïcode"}]
+    monkeypatch.setattr(Busy38Client, "list_missions", lambda self: missions)
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+    cli_mod._console.cache_clear()
+    formatters._console.cache_clear()
+
+    result = CliRunner().invoke(
+        cli_mod.cli, ["--config", str(cfg_file), "--json", "mission", "list"]
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == missions
+    assert cli_mod._console.cache_info().currsize == 0
+    assert formatters._console.cache_info().currsize == 0
+
+
+def test_json_flag_wraps_mission_and_notes(monkeypatch, tmp_path):
+    import json
+
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+    from busy_bridge.client import Busy38Client
+
+    monkeypatch.setattr(Busy38Client, "get_mission", lambda self, mid: {"mission_id": mid})
+    monkeypatch.setattr(Busy38Client, "get_mission_notes", lambda self, mid: [{"title": "n"}])
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+    runner = CliRunner()
+    base = ["--config", str(cfg_file), "--json", "mission", "show", "m1"]
+
+    assert json.loads(runner.invoke(cli, base).output) == {"mission_id": "m1"}
+    assert json.loads(runner.invoke(cli, base + ["--notes"]).output) == {
+        "mission": {"mission_id": "m1"},
+        "notes": [{"title": "n"}],
+    }
+
+
+def test_json_flag_covers_write_commands_and_rejects_text_only_modes(monkeypatch, tmp_path):
+    import json
+
+    from click.testing import CliRunner
+
+    from busy_bridge.cli import cli
+    from busy_bridge.client import Busy38Client
+
+    started = []
+    monkeypatch.setattr(
+        Busy38Client,
+        "start_mission",
+        lambda self, **kw: started.append(kw) or {"success": True, "mission_id": "m9"},
+    )
+    monkeypatch.setattr(
+        Busy38Client,
+        "cancel_mission",
+        lambda self, mid, reason: {"success": False, "error": "gone"},
+    )
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\napi_key: sekrit\n", encoding="utf-8")
+    runner = CliRunner()
+    base = ["--config", str(cfg_file), "--json"]
+
+    out = runner.invoke(cli, base + ["start", "audit"])
+    assert json.loads(out.output) == {"success": True, "mission_id": "m9"}
+    out = runner.invoke(cli, base + ["mission", "cancel", "m9"])
+    assert json.loads(out.output) == {"success": False, "error": "gone"}
+
+    shown = json.loads(runner.invoke(cli, base + ["settings", "show"]).output)
+    assert shown["url"] == "http://localhost:8080"
+    assert "sekrit" not in json.dumps(shown)
+
+    follow = runner.invoke(cli, base + ["mission", "start", "audit", "--follow"])
+    assert follow.exit_code == 2
+    assert "--json is not supported with --follow" in follow.output
+    assert len(started) == 1
+
+    daemon = runner.invoke(cli, base + ["daemon", "start"])
+    assert daemon.exit_code == 2
+    assert "--json is not supported by `daemon start`" in daemon.output
@@ -4,10 +4,7 @@ from busy_bridge.cli import cli
 from busy_bridge.client import Busy38Client
 
 
-def test_mission_start_follow_runs_stream(monkeypatch, tmp_path):
-    cfg_file = tmp_path / "bridge.yaml"
-    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
-
+def _patch_mission_stream(monkeypatch):
     monkeypatch.setattr(
         Busy38Client,
         "start_mission",
@@ -30,9 +27,29 @@ def test_mission_start_follow_runs_stream(monkeypatch, tmp_path):
         ),
     )
 
+
+def test_mission_start_follow_runs_stream(monkeypatch, tmp_path):
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+    _patch_mission_stream(monkeypatch)
+
     runner = CliRunner()
-    result = runner.invoke(cli, ["--config", str(cfg_file), "mission", "start", "build docs", "--follow"])
+    result = runner.invoke(
+        cli, ["--config", str(cfg_file), "mission", "start", "build docs", "--follow"]
+    )
     assert result.exit_code == 0
     assert "Mission started: m1" in result.output
     assert "Mission state: running" in result.output
     assert "Mission state: approved" in result.output
+
+
+def test_start_shortcut_follow_runs_stream(monkeypatch, tmp_path):
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+    _patch_mission_stream(monkeypatch)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config", str(cfg_file), "start", "build docs", "-f"])
+    assert result.exit_code == 0, result.output
+    assert "Mission started: m1" in result.output
+    assert "Mission state: approved" in result.output
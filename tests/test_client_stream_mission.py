@@ -1,5 +1,6 @@
 from typing import Any, Dict, List
 
+import httpx
 import pytest
 
 from busy_bridge.client import Busy38Client, Busy38Error
@@ -49,3 +50,43 @@ def test_stream_mission_raises_when_poll_limit_reached(monkeypatch):
 
     with pytest.raises(Busy38Error, match="Mission stream timed out"):
         list(client.stream_mission("m2", poll_interval=0.0, max_polls=1))
+
+
+def test_client_uses_configured_pool_and_closes(monkeypatch):
+    seen = {}
+    real_transport = httpx.HTTPTransport
+
+    def spy_transport(**kwargs):
+        seen.update(kwargs)
+        return real_transport(**kwargs)
+
+    monkeypatch.setattr("busy_bridge.client.httpx.HTTPTransport", spy_transport)
+    with Busy38Client(Config(url="http://localhost:8080", max_connections=4)) as client:
+        pass
+    assert seen["limits"].max_connections == 4
+    assert seen["retries"] == 1
+    assert client.client.is_closed
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_request_decodes_json_with_and_without_orjson(monkeypatch, use_orjson):
+    import busy_bridge.client as client_mod
+
+    if not use_orjson:
+        monkeypatch.setattr(client_mod, "orjson", None)
+    elif client_mod.orjson is None:
+        pytest.skip("orjson not installed")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missions/bad":
+            return httpx.Response(400, content=b"not json")
+        return httpx.Response(200, json={"missions": [{"mission_id": "mé"}]})
+
+    client = _make_client()
+    client.client = httpx.Client(
+        base_url="http://localhost:8080", transport=httpx.MockTransport(handler)
+    )
+    assert client.list_missions() == [{"mission_id": "mé"}]
+    with pytest.raises(Busy38Error) as excinfo:
+        client.get_mission("bad")
+    assert excinfo.value.details == {}
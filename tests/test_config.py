@@ -31,3 +31,59 @@ def test_save_roundtrip_model_settings(tmp_path):
     assert loaded.model_settings["model"] == "gpt-4o-mini"
     assert loaded.imported_from == "openclaw"
 
+
+def test_pool_settings_roundtrip_only_when_changed(tmp_path):
+    out_path = Config().save(tmp_path / "defaults.yaml")
+    assert "max_connections" not in out_path.read_text(encoding="utf-8")
+
+    cfg = Config(max_connections=8, keepalive_expiry=5.0)
+    loaded = Config.from_file(cfg.save(tmp_path / "tuned.yaml"))
+    assert loaded.max_connections == 8
+    assert loaded.keepalive_expiry == 5.0
+    assert loaded.max_keepalive_connections == Config().max_keepalive_connections
+    assert loaded.http2 is False
+
+
+def test_from_file_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    import yaml
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("url: http://a\nmodel_settings:\n  model: m1\n", encoding="utf-8")
+
+    loads = []
+    real_load = yaml.load
+
+    def counting_load(stream, Loader):
+        loads.append(Loader)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+
+    first = Config.from_file(cfg_path)
+    first.model_settings["model"] = "mutated"
+    second = Config.from_file(cfg_path)
+    assert len(loads) == 1
+    assert second.model_settings == {"model": "m1"}
+
+    cfg_path.write_text("url: http://changed\n", encoding="utf-8")
+    assert Config.from_file(cfg_path).url == "http://changed"
+    assert len(loads) == 2
+
+
+def test_from_env_tracks_environment_changes(monkeypatch):
+    monkeypatch.setenv("BUSY38_URL", "http://one")
+    monkeypatch.setenv("BUSY38_TIMEOUT", "5")
+    first = Config.from_env()
+    first.url = "http://mutated"
+    assert Config.from_env().url == "http://one"
+    assert Config.from_env().timeout == 5
+
+    monkeypatch.setenv("BUSY38_URL", "http://two")
+    assert Config.from_env().url == "http://two"
+
+
+def test_config_and_detection_result_use_slots():
+    from busy_bridge.import_settings import DetectionResult
+
+    assert not hasattr(Config(), "__dict__")
+    assert not hasattr(DetectionResult(system="s", config_path=Path("x")), "__dict__")
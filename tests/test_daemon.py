@@ -0,0 +1,156 @@
+import io
+import subprocess
+import sys
+
+import pytest
+
+from busy_bridge.daemon import run_client, send_control
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    sock = tmp_path / "d.sock"
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from busy_bridge.daemon import serve\n"
+            f"serve(Path({str(sock)!r}), ready=sys.stdout)\n",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert proc.stdout.readline().strip() == str(sock)
+        yield sock
+    finally:
+        if proc.poll() is None:
+            send_control("stop", sock)
+        proc.wait(timeout=10)
+        proc.stdout.close()
+
+
+def test_run_client_returns_none_without_daemon(tmp_path):
+    assert run_client(["--version"], path=tmp_path / "missing.sock") is None
+
+
+def test_daemon_runs_commands_and_streams_output(running_daemon, tmp_path):
+    out, err = io.StringIO(), io.StringIO()
+    assert run_client(["--version"], path=running_daemon, stdout=out, stderr=err) == 0
+    assert out.getvalue() == "busy-bridge, version 0.2.0\n"
+
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://daemon-test:9999\n", encoding="utf-8")
+    out = io.StringIO()
+    code = run_client(
+        ["--config", str(cfg_file), "settings", "show"], path=running_daemon, stdout=out, stderr=err
+    )
+    assert code == 0, err.getvalue()
+    assert "http://daemon-test:9999" in out.getvalue()
+
+    out, err = io.StringIO(), io.StringIO()
+    assert run_client(["nope"], path=running_daemon, stdout=out, stderr=err) == 2
+    assert "No such command" in err.getvalue()
+
+
+def test_daemon_status_and_stop(running_daemon):
+    reply = send_control("ping", running_daemon)
+    assert reply["exit"] == 0
+    assert isinstance(reply["pid"], int)
+    assert send_control("stop", running_daemon) == {"exit": 0}
+
+
+def test_run_client_forwards_only_the_env_the_cli_reads(monkeypatch):
+    from busy_bridge import daemon
+
+    env = daemon._forwarded_env(
+        {
+            "BUSY38_API_KEY": "k",
+            "BUSY_NO_SPINNER": "1",
+            "HOME": "/home/u",
+            "LC_ALL": "C",
+            "AWS_SECRET_ACCESS_KEY": "nope",
+            "GITHUB_TOKEN": "nope",
+        }
+    )
+    assert env == {"BUSY38_API_KEY": "k", "BUSY_NO_SPINNER": "1", "HOME": "/home/u", "LC_ALL": "C"}
+
+
+def test_client_refuses_a_listener_owned_by_another_user(running_daemon, monkeypatch):
+    import os
+
+    from busy_bridge import daemon
+
+    monkeypatch.setattr(daemon, "_peer_uid", lambda conn: os.getuid() + 1)
+    with pytest.raises(daemon.DaemonError, match="listener runs as uid"):
+        run_client(["--version"], path=running_daemon, stdout=io.StringIO())
+
+
+def test_serve_refuses_to_replace_a_non_socket(tmp_path):
+    from busy_bridge import daemon
+
+    victim = tmp_path / "notes.txt"
+    victim.write_text("keep me", encoding="utf-8")
+    with pytest.raises(daemon.DaemonError, match="not a socket"):
+        daemon.serve(victim)
+    assert victim.read_text(encoding="utf-8") == "keep me"
+
+
+def test_serve_fails_closed_without_peer_credentials(tmp_path, monkeypatch):
+    from busy_bridge import daemon
+
+    monkeypatch.setattr(daemon, "_peercred_option", lambda: None)
+    with pytest.raises(daemon.DaemonError, match="peer credentials"):
+        daemon.serve(tmp_path / "d.sock")
+    assert not (tmp_path / "d.sock").exists()
+
+
+def test_default_socket_dir_is_private(tmp_path, monkeypatch):
+    import os
+    import tempfile
+
+    from busy_bridge import daemon
+
+    monkeypatch.delenv("BUSY_BRIDGE_DAEMON_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    path = daemon.socket_path()
+    assert path.parent == tmp_path / f"busy-bridge-{os.getuid()}"
+
+    daemon._ensure_private_dir(path.parent)
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+
+    path.parent.chmod(0o755)
+    with pytest.raises(daemon.DaemonError, match="0700"):
+        daemon._ensure_private_dir(path.parent)
+
+
+def test_send_control_treats_a_reset_connection_as_no_daemon(tmp_path, monkeypatch):
+    from busy_bridge import daemon
+
+    class ResetSocket:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def makefile(self, mode):
+            return io.BytesIO()
+
+        def sendall(self, data):
+            raise ConnectionResetError(104, "Connection reset by peer")
+
+    monkeypatch.setattr(daemon, "_connect", lambda path: ResetSocket())
+    assert send_control("stop", tmp_path / "d.sock") is None
+
+
+def test_daemon_reports_an_unusable_cwd(running_daemon, tmp_path, monkeypatch):
+    gone = tmp_path / "gone"
+    out, err = io.StringIO(), io.StringIO()
+    monkeypatch.setattr("busy_bridge.daemon.os.getcwd", lambda: str(gone))
+    assert run_client(["--version"], path=running_daemon, stdout=out, stderr=err) == 1
+    assert "busy-bridge daemon:" in err.getvalue()
+    assert str(gone) in err.getvalue()
@@ -0,0 +1,56 @@
+from busy_bridge.formatters import _trunc
+
+
+def test_trunc_keeps_short_text_and_caps_long_text_at_width():
+    assert _trunc("", 10) == ""
+    assert _trunc("x" * 10, 10) == "x" * 10
+    assert _trunc("x" * 11, 10) == "x" * 7 + "..."
+    assert len(_trunc("y" * 500, 60)) == 60
+
+
+def test_mission_list_renders_state_cells_literally(monkeypatch):
+    from rich.console import Console
+
+    from busy_bridge import formatters
+
+    console = Console(record=True, width=120, color_system=None)
+    monkeypatch.setattr(formatters, "_console", lambda: console)
+    formatters.format_mission_list(
+        [
+            {"mission_id": "m1", "objective": "a", "state": "running"},
+            {"mission_id": "m2", "objective": "b", "state": "running"},
+            {"mission_id": "m3", "objective": "c", "state": "[odd]"},
+        ]
+    )
+    text = console.export_text()
+    assert text.count("running") == 2
+    assert "[odd]" in text
+
+
+def test_mission_list_formats_iso_and_keeps_unparseable_created_at(monkeypatch):
+    from rich.console import Console
+
+    from busy_bridge import formatters
+
+    console = Console(record=True, width=120, color_system=None)
+    monkeypatch.setattr(formatters, "_console", lambda: console)
+    formatters.format_mission_list(
+        [
+            {"mission_id": "m1", "state": "running", "created_at": "2026-03-04T05:06:07Z"},
+            {"mission_id": "m2", "state": "running", "created_at": "yesterday"},
+        ]
+    )
+    text = console.export_text()
+    assert "2026-03-04 05:06" in text
+    assert "yesterday" in text
+
+
+def test_cli_and_formatters_share_one_unhighlighted_console():
+    from busy_bridge import cli, formatters
+
+    cli._console.cache_clear()
+    formatters._console.cache_clear()
+    console = cli._console()
+    assert console is formatters._console()
+    assert console._highlight is False
+    assert console.soft_wrap is False
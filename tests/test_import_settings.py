@@ -157,3 +157,492 @@ def test_import_detection_to_squid_store_writes_settings_even_if_empty(monkeypat
     assert out.success is True
     assert out.imported_secret_count == 1
     assert out.imported_settings_count == 1
+
+
+def test_detect_installed_system_configs_rescans_and_returns_fresh_results(tmp_path):
+    root = tmp_path / "scan_root"
+    root.mkdir()
+    assert detect_installed_system_configs(source="openclaw", roots=[root]) == []
+
+    # A config written after an empty scan is still found.
+    cfg_path = root / ".config" / "openclaw" / "config.yaml"
+    cfg_path.parent.mkdir(parents=True, exist_ok=True)
+    cfg_path.write_text(
+        "llm:\n  model: gpt-4.1-mini\nagent:\n  persona: [helpful]\n"
+        "api_key: sk-test-1234567890\n",
+        encoding="utf-8",
+    )
+    (first,) = detect_installed_system_configs(source="openclaw", roots=[root])
+
+    first.model_settings["model"] = "changed"
+    first.secrets.clear()
+    first.agent_settings["persona"].append("leaked")
+
+    (second,) = detect_installed_system_configs(source="openclaw", roots=[root])
+    assert second is not first
+    assert second.model_settings["model"] == "gpt-4.1-mini"
+    assert second.secrets
+    assert second.agent_settings["persona"] == ["helpful"]
+
+
+def test_detect_reparses_only_changed_config_files(tmp_path, monkeypatch):
+    import busy_bridge.import_settings as import_settings
+
+    root = tmp_path / "scan_root"
+    cfg_path = root / ".codex" / "config.json"
+    cfg_path.parent.mkdir(parents=True)
+    cfg_path.write_text('{"model": "one"}', encoding="utf-8")
+
+    calls = []
+    real_parse = import_settings._parse_config
+
+    def counting_parse(path):
+        calls.append(path)
+        return real_parse(path)
+
+    monkeypatch.setattr(import_settings, "_parse_config", counting_parse)
+
+    def detect():
+        return detect_installed_system_configs(source="codex", roots=[root])
+
+    assert detect()[0].model_settings == {"model": "one"}
+    assert detect()[0].model_settings == {"model": "one"}
+    assert len(calls) == 1
+
+    cfg_path.write_text('{"model": "second"}', encoding="utf-8")
+    assert detect()[0].model_settings == {"model": "second"}
+    assert len(calls) == 2
+
+
+def test_cli_settings_import_to_squidstore_saves_config_and_store(tmp_path, monkeypatch):
+    import busy_bridge.import_settings as import_settings
+    from busy_bridge.import_settings import SquidStoreImportResult
+
+    root = tmp_path / "scan_root"
+    detected = root / ".config" / "openclaw" / "config.yaml"
+    detected.parent.mkdir(parents=True, exist_ok=True)
+    detected.write_text("llm:\n  provider: openai\n  model: gpt-4.1-mini\n", encoding="utf-8")
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+    db_file = tmp_path / "store.duckdb"
+
+    calls = []
+
+    def fake_import(detection, **kwargs):
+        calls.append((detection.system, kwargs["db_path"]))
+        return SquidStoreImportResult(
+            success=True,
+            db_path=kwargs["db_path"],
+            source_system=detection.system,
+            imported_settings_count=1,
+        )
+
+    monkeypatch.setattr(import_settings, "import_detection_to_squid_store", fake_import)
+    monkeypatch.setenv("BUSY_BRIDGE_IMPORT_SCAN_DIRS", str(root))
+    res = CliRunner().invoke(
+        cli,
+        [
+            "--config",
+            str(cfg_file),
+            "settings",
+            "import",
+            "--source",
+            "openclaw",
+            "--to-squidstore",
+            "--squidstore-db",
+            str(db_file),
+        ],
+    )
+    assert res.exit_code == 0, res.output
+    assert calls == [("openclaw", db_file.resolve())]
+    assert Config.from_file(cfg_file).model_settings["model"] == "gpt-4.1-mini"
+    assert "Squid store import complete" in res.output
+
+
+def test_flatten_dict_is_depth_first_with_dotted_keys():
+    from busy_bridge.import_settings import _flatten_dict
+
+    data = {
+        "a": 1,
+        "llm": {"model": "m", "opts": {"temperature": 0.2, "empty": {}}, "provider": "p"},
+        "z": None,
+        3: "int-key",
+    }
+    flat = _flatten_dict(data)
+    assert list(flat.items()) == [
+        ("a", 1),
+        ("llm.model", "m"),
+        ("llm.opts.temperature", 0.2),
+        ("llm.provider", "p"),
+        ("z", None),
+        ("3", "int-key"),
+    ]
+
+    deep = current = {}
+    for _ in range(2000):
+        current["n"] = {}
+        current = current["n"]
+    current["leaf"] = 1
+    assert list(_flatten_dict(deep).values()) == [1]
+
+
+def test_detect_skips_directories_named_like_config_files(tmp_path):
+    root = tmp_path / "scan_root"
+    (root / ".config" / "codex" / "config.yaml").mkdir(parents=True)
+    real = root / ".codex" / "config.json"
+    real.parent.mkdir(parents=True)
+    real.write_text('{"model": "o4-mini"}', encoding="utf-8")
+
+    found = detect_installed_system_configs(source="codex", roots=[root])
+    assert [hit.config_path for hit in found] == [real.resolve()]
+
+
+def test_detect_lists_each_directory_once_and_follows_symlinks(tmp_path, monkeypatch):
+    import os
+
+    root = tmp_path / "scan_root"
+    target = tmp_path / "elsewhere.yaml"
+    target.write_text("model: sonnet\n", encoding="utf-8")
+    link = root / ".claude" / "config.yaml"
+    link.parent.mkdir(parents=True)
+    link.symlink_to(target)
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    found = detect_installed_system_configs(roots=[root])
+
+    assert [hit.system for hit in found] == ["claude"]
+    assert found[0].config_path == target.resolve()
+    assert sorted(scanned) == sorted({str(root), str(root / ".claude")})
+
+
+def test_detect_orders_by_system_then_root_and_skips_missing_roots(tmp_path):
+    first, second = tmp_path / "a", tmp_path / "b"
+    for root, model in ((first, "m-a"), (second, "m-b")):
+        for rel in (".codex/config.json", ".claude/settings.json"):
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f'{{"model": "{model}"}}', encoding="utf-8")
+
+    found = detect_installed_system_configs(roots=[second, tmp_path / "missing", first])
+    assert [(hit.system, hit.model_settings["model"]) for hit in found] == [
+        ("claude", "m-b"),
+        ("claude", "m-a"),
+        ("codex", "m-b"),
+        ("codex", "m-a"),
+    ]
+
+
+def test_dedupe_paths_is_lexical_and_symlinked_roots_report_once(tmp_path):
+    from busy_bridge.import_settings import _dedupe_paths
+
+    real = tmp_path / "real"
+    cfg = real / ".codex" / "config.json"
+    cfg.parent.mkdir(parents=True)
+    cfg.write_text('{"model": "o4-mini"}', encoding="utf-8")
+    alias = tmp_path / "alias"
+    alias.symlink_to(real)
+
+    roots = _dedupe_paths([real, tmp_path / "x" / ".." / "real", alias])
+    assert roots == [real, alias]
+
+    found = detect_installed_system_configs(source="codex", roots=roots)
+    assert [hit.config_path for hit in found] == [cfg.resolve()]
+
+
+def test_extract_model_settings_prefers_earlier_candidates():
+    from busy_bridge.import_settings import _extract_model_settings
+
+    data = {
+        "inference": {"model": "late", "provider": "p2"},
+        "llm": {"model": "", "provider": "p1"},
+        "default_model": "early",
+        "max_tokens": None,
+    }
+    assert _extract_model_settings(data) == {"model": "early", "provider": "p1"}
+
+
+def test_secret_key_name_check_matches_reference_regex():
+    from busy_bridge.import_settings import SECRET_KEY_RE, _is_secret_key_name
+
+    keys = [
+        "OPENAI_API_KEY",
+        "providers.openai.apiKey",
+        "api-key",
+        "api.key",
+        "auth.ACCESS_TOKEN",
+        "refresh-token",
+        "client_secret",
+        "db.Password",
+        "passwd",
+        "llm.model",
+        "tokenizer",
+        "\u212aey",
+        "api\u212aey",
+        "",
+    ]
+    for key in keys:
+        assert _is_secret_key_name(key) == bool(SECRET_KEY_RE.search(key)), key
+
+
+def test_placeholder_values_are_not_secrets():
+    from busy_bridge.import_settings import PLACEHOLDER_SECRET_RE, _is_probable_secret
+
+    values = [
+        "your-api-key-here",
+        "YOUR_TOKEN_GOES_HERE",
+        "Example secret value",
+        "changeme-please-now",
+        "testing1234567",
+        "dummy-value-12345",
+        "PlaceholderValue123",
+        "sk-live-abcdefghijklmnop",
+        "ſk-prefixed-value-1",
+    ]
+    for value in values:
+        expected = PLACEHOLDER_SECRET_RE.match(value) is None
+        assert _is_probable_secret("api_key", value) == expected, value
+
+
+def test_detect_flattens_each_config_once(tmp_path, monkeypatch):
+    import busy_bridge.import_settings as import_settings
+
+    root = tmp_path / "scan_root"
+    cfg_path = root / ".claude" / "settings.json"
+    cfg_path.parent.mkdir(parents=True)
+    cfg_path.write_text(
+        '{"llm": {"model": "opus"}, "agent": {"name": "a"}, "auth": {"api_key": "sk-real-value-123"}}',
+        encoding="utf-8",
+    )
+
+    flattened = []
+    real_flatten = import_settings._flatten_dict
+
+    def counting_flatten(data):
+        flattened.append(data)
+        return real_flatten(data)
+
+    monkeypatch.setattr(import_settings, "_flatten_dict", counting_flatten)
+    (hit,) = detect_installed_system_configs(source="claude", roots=[root])
+
+    assert len(flattened) == 1
+    assert hit.model_settings == {"model": "opus"}
+    assert hit.agent_settings == {"agent_name": "a"}
+    assert hit.secrets == {"auth_api_key": "sk-real-value-123"}
+
+
+def test_keystore_class_is_loaded_once_per_source_dir(tmp_path, monkeypatch):
+    import sys
+
+    import busy_bridge.import_settings as import_settings
+
+    monkeypatch.setattr(import_settings, "_keystore_class_hits", {})
+    src = tmp_path / "src"
+    monkeypatch.setenv("BUSY_BRIDGE_KEY_STORE_SRC", str(src))
+    monkeypatch.chdir(tmp_path)
+
+    # A miss is not remembered: the checkout created afterwards is found.
+    assert import_settings._resolve_keystore_class() is None
+
+    pkg = src / "key_store"
+    pkg.mkdir(parents=True)
+    (pkg / "models.py").write_text("LOADS = []\n", encoding="utf-8")
+    (pkg / "store.py").write_text(
+        "from key_store import models\n"
+        "models.LOADS.append(1)\n"
+        "class KeyStore:\n"
+        "    pass\n",
+        encoding="utf-8",
+    )
+
+    first = import_settings._resolve_keystore_class()
+    second = import_settings._resolve_keystore_class()
+
+    assert first is not None and first is second
+    assert first.__module__ == "key_store.store"
+    assert "key_store" not in sys.modules
+
+    monkeypatch.setenv("BUSY_BRIDGE_KEY_STORE_SRC", str(tmp_path / "missing"))
+    assert import_settings._resolve_keystore_class() is not first
+
+
+def test_resolve_path_matches_pathlib_and_follows_cwd(tmp_path, monkeypatch):
+    from busy_bridge.import_settings import _resolve_path
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "a")
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert _resolve_path("db.duckdb") == (tmp_path / "a" / "db.duckdb").resolve()
+    monkeypatch.chdir(tmp_path / "b")
+    assert _resolve_path("db.duckdb") == (tmp_path / "b" / "db.duckdb").resolve()
+    assert _resolve_path(tmp_path / "link" / "x") == (tmp_path / "link" / "x").resolve()
+
+
+def test_parse_config_json_with_and_without_orjson(tmp_path, monkeypatch):
+    import json
+
+    import busy_bridge.import_settings as import_settings
+
+    cfg_path = tmp_path / "settings.json"
+    cfg_path.write_text('{"llm": {"model": "m", "temperature": 0.5}}', encoding="utf-8")
+    expected = {"llm": {"model": "m", "temperature": 0.5}}
+
+    assert import_settings._parse_config(cfg_path) == expected
+    monkeypatch.setattr(import_settings, "_json_loads", json.loads)
+    assert import_settings._parse_config(cfg_path) == expected
+
+
+def test_detect_skips_unparseable_files_among_many(tmp_path):
+    root = tmp_path / "scan_root"
+    files = {
+        ".codex/config.json": '{"model": "codex-model"}',
+        ".claude/settings.json": "{not json",
+        ".openclaw/config.yaml": "model: claw-model\n",
+    }
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True)
+        path.write_text(text, encoding="utf-8")
+
+    found = detect_installed_system_configs(roots=[root])
+    assert [(hit.system, hit.model_settings["model"]) for hit in found] == [
+        ("codex", "codex-model"),
+        ("openclaw", "claw-model"),
+    ]
+
+
+def test_extracted_secrets_are_ordered_by_name():
+    from busy_bridge.import_settings import _extract_secrets
+
+    data = {"zeta_token": "z" * 16, "auth": {"api_key": "a" * 16}, "b_secret": "b" * 16}
+    assert list(_extract_secrets(data)) == ["auth_api_key", "b_secret", "zeta_token"]
+
+
+def test_import_detections_to_squid_store_opens_store_once(monkeypatch, tmp_path):
+    import busy_bridge.import_settings as mod
+    from busy_bridge.import_settings import import_detections_to_squid_store
+
+    events = []
+
+    class FakeStore:
+        def __init__(self, path):
+            events.append("open")
+
+        def save_password(self, **kwargs):
+            if kwargs["name"] == "import.codex.bad_token":
+                raise RuntimeError("rejected")
+            events.append(kwargs["name"])
+
+        def close(self):
+            events.append("close")
+
+    monkeypatch.setattr(mod, "_resolve_keystore_class", lambda: FakeStore)
+    detections = [
+        DetectionResult(system="claude", config_path=Path("/c"), secrets={"api_key": "x" * 12}),
+        DetectionResult(system="codex", config_path=Path("/x"), secrets={"bad_token": "y" * 12}),
+    ]
+    results = import_detections_to_squid_store(detections, db_path=tmp_path / "k.duckdb")
+
+    assert events == [
+        "open",
+        "import.claude.api_key",
+        "import.claude.settings",
+        "import.codex.settings",
+        "close",
+    ]
+    assert [r.source_system for r in results] == ["claude", "codex"]
+    assert [r.success for r in results] == [True, False]
+    assert results[1].errors == ["secret bad_token: rejected"]
+    assert import_detections_to_squid_store([]) == []
+
+
+def test_parse_env_text_unquotes_one_matching_pair():
+    from busy_bridge.import_settings import _parse_env_text
+
+    text = (
+        "# comment\n"
+        "PLAIN = value \n"
+        'DOUBLE="quoted value"\n'
+        "SINGLE='it''s'\n"
+        'EMPTY=""\n'
+        "NESTED='\"inner\"'\n"
+        'LONE="unterminated\n'
+        "URL=http://host/?a=b\n"
+        "=novalue\n"
+        "noequals\n"
+    )
+    assert _parse_env_text(text) == {
+        "PLAIN": "value",
+        "DOUBLE": "quoted value",
+        "SINGLE": "it''s",
+        "EMPTY": "",
+        "NESTED": '"inner"',
+        "LONE": '"unterminated',
+        "URL": "http://host/?a=b",
+    }
+
+
+def test_cli_settings_import_skips_squidstore_when_save_fails(tmp_path, monkeypatch):
+    import busy_bridge.import_settings as import_settings
+
+    root = tmp_path / "scan_root"
+    detected = root / ".config" / "openclaw" / "config.yaml"
+    detected.parent.mkdir(parents=True, exist_ok=True)
+    detected.write_text("llm:\n  provider: openai\n  model: gpt-4.1-mini\n", encoding="utf-8")
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+
+    calls = []
+    monkeypatch.setattr(
+        import_settings, "import_detection_to_squid_store", lambda *a, **k: calls.append(a)
+    )
+
+    def failing_save(self, path=None):
+        raise PermissionError("read-only config")
+
+    monkeypatch.setattr(Config, "save", failing_save)
+    monkeypatch.setenv("BUSY_BRIDGE_IMPORT_SCAN_DIRS", str(root))
+    res = CliRunner().invoke(
+        cli,
+        [
+            "--config",
+            str(cfg_file),
+            "settings",
+            "import",
+            "--source",
+            "openclaw",
+            "--to-squidstore",
+        ],
+    )
+    assert isinstance(res.exception, PermissionError)
+    assert calls == []
+
+
+def test_cli_settings_import_json_reports_one_object(tmp_path, monkeypatch):
+    import json
+
+    root = tmp_path / "scan_root"
+    detected = root / ".config" / "openclaw" / "config.yaml"
+    detected.parent.mkdir(parents=True, exist_ok=True)
+    detected.write_text("llm:\n  provider: openai\n  model: gpt-4.1-mini\n", encoding="utf-8")
+    cfg_file = tmp_path / "bridge.yaml"
+    cfg_file.write_text("url: http://localhost:8080\n", encoding="utf-8")
+    monkeypatch.setenv("BUSY_BRIDGE_IMPORT_SCAN_DIRS", str(root))
+
+    res = CliRunner().invoke(
+        cli, ["--config", str(cfg_file), "--json", "settings", "import", "--source", "openclaw"]
+    )
+    assert res.exit_code == 0, res.output
+    report = json.loads(res.output)
+    assert report["source"] == "openclaw"
+    assert report["model_settings"]["model"] == "gpt-4.1-mini"
+    assert report["saved_to"] == str(cfg_file.resolve())
+    assert report["squidstore"] is None
@@ -0,0 +1,360 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from busy_bridge import adapter as adapter_mod
+from busy_bridge import server
+
+
+class FakeAdapter:
+    def __init__(self):
+        self.tools = [{"name": "read_file", "description": "Read", "category": "general"}]
+        self.missions = [{"mission_id": "m1", "state": "running"}]
+        self.mission_version = 1
+        self.calls = []
+
+    async def list_tools(self):
+        self.calls.append("list_tools")
+        return list(self.tools)
+
+    async def list_missions(self, since_version=0):
+        self.calls.append(("list_missions", since_version))
+        return list(self.missions)
+
+    async def list_missions_page(self, since_version=0, limit=None):
+        self.calls.append(("list_missions_page", since_version, limit))
+        return list(self.missions)[:limit], since_version + 1
+
+    async def make_tool(self, description):
+        # Like Busy38Adapter.make_tool: only starts a tool-builder mission; the
+        # tool registers later, when that mission completes.
+        self.missions.append({"mission_id": "m2", "state": "pending"})
+        return "m2"
+
+    async def shutdown(self):
+        return None
+
+
+@pytest.fixture
+def fake_adapter(monkeypatch):
+    fake = FakeAdapter()
+    monkeypatch.setattr(adapter_mod, "_adapter", fake)
+    server._TOOLS_BODY.clear()
+    yield fake
+    server._TOOLS_BODY.clear()
+
+
+@pytest.fixture
+def client(fake_adapter):
+    # Entering the client runs the lifespan, which stores the adapter on app.state.
+    with TestClient(server.app) as client:
+        yield client
+
+
+def test_tools_listing_is_cached_for_its_ttl(fake_adapter, client, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+
+    first = client.get("/tools")
+    assert client.post("/tools/make", json={"description": "rss"}).status_code == 200
+    # The builder mission registers its tool after make returns.
+    fake_adapter.tools.append({"name": "new", "description": "rss", "category": "general"})
+    second = client.get("/tools")
+    assert first.json() == second.json() == {"tools": fake_adapter.tools[:1]}
+    assert first.headers["content-type"] == "application/json"
+    assert fake_adapter.calls == ["list_tools"]
+
+    now[0] += 1.5
+    assert [t["name"] for t in client.get("/tools").json()["tools"]] == ["read_file", "new"]
+    assert fake_adapter.calls == ["list_tools", "list_tools"]
+
+
+def test_full_mission_listing_reencodes_only_when_missions_change(
+    fake_adapter, client, monkeypatch
+):
+    encoded = []
+    real_encode = server._encode_json
+
+    def counting_encode(content):
+        encoded.append(content)
+        return real_encode(content)
+
+    monkeypatch.setattr(server, "_encode_json", counting_encode)
+
+    expected = {"missions": fake_adapter.missions, "version": 1}
+    assert client.get("/missions").json() == expected
+    assert client.get("/missions").json() == expected
+    assert len(encoded) == 1
+
+    fake_adapter.missions.append({"mission_id": "m2", "state": "pending"})
+    fake_adapter.mission_version = 2
+    assert len(client.get("/missions").json()["missions"]) == 2
+    fake_adapter.missions.pop(0)
+    assert client.get("/missions").json()["missions"] == [{"mission_id": "m2", "state": "pending"}]
+    assert len(encoded) == 3
+
+    assert client.get("/missions", params={"since_version": 1}).json()["version"] == 2
+    assert len(encoded) == 4
+    assert [c for c in fake_adapter.calls if c[0] == "list_missions"] == [
+        ("list_missions", 0)
+    ] * 4 + [("list_missions", 1)]
+
+
+def test_health_body_is_rebuilt_once_per_second(monkeypatch):
+    from datetime import datetime
+
+    client = TestClient(server.app)
+    monkeypatch.setattr(server, "_health_cache", (-1, b""))
+    monkeypatch.setattr(server.time, "time", lambda: 1767225600.9)
+
+    first = client.get("/health")
+    cached = server._health_cache
+    assert client.get("/health").content == first.content
+    assert server._health_cache is cached
+    assert first.json() == {
+        "status": "healthy",
+        "version": "0.2.0",
+        "timestamp": "2026-01-01T00:00:00",
+        "busy38_connected": True,
+    }
+    assert datetime.fromisoformat(first.json()["timestamp"]).tzinfo is None
+
+    monkeypatch.setattr(server.time, "time", lambda: 1767225601.2)
+    assert client.get("/health").json()["timestamp"] == "2026-01-01T00:00:01"
+
+
+def test_routes_use_the_adapter_from_lifespan_and_fail_without_it(fake_adapter, monkeypatch):
+    with TestClient(server.app) as client:
+        assert server.app.state.adapter is fake_adapter
+
+        async def must_not_be_called():
+            raise AssertionError("routes must not await get_adapter per request")
+
+        monkeypatch.setattr(server, "get_adapter", must_not_be_called)
+        assert client.get("/tools").status_code == 200
+
+    assert server.app.state.adapter is None
+    response = TestClient(server.app).get("/tools")
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Busy38 adapter is not initialized"}
+
+
+def test_cors_allows_the_client_headers_and_can_be_disabled():
+    import os
+    import subprocess
+    import sys
+
+    client = TestClient(server.app)
+    preflight = client.options(
+        "/missions",
+        headers={
+            "Origin": "http://example.test",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "Authorization, Content-Type, X-Agent-ID",
+        },
+    )
+    assert preflight.status_code == 200
+
+    probe = (
+        "from busy_bridge import server\n"
+        "print(any(m.cls.__name__ == 'CORSMiddleware' for m in server.app.user_middleware))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe],
+        env={**os.environ, "BUSY_BRIDGE_ENABLE_CORS": "0"},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert out.stdout.strip() == "False"
+
+    probe = (
+        "from busy_bridge import server\n"
+        "print([m.kwargs['allow_origins'] for m in server.app.user_middleware\n"
+        "       if m.cls.__name__ == 'CORSMiddleware'])\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe],
+        env={**os.environ, "BUSY_BRIDGE_CORS_ORIGINS": "http://a.test, http://b.test"},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert out.stdout.strip() == "[['http://a.test', 'http://b.test']]"
+
+
+def test_start_server_leaves_loop_choice_to_uvicorn_and_silences_access_log(monkeypatch):
+    import uvicorn
+
+    runs = []
+    monkeypatch.setattr(uvicorn, "run", lambda app, **kwargs: runs.append(kwargs))
+    monkeypatch.delenv("BUSY_BRIDGE_ACCESS_LOG", raising=False)
+    server.start_server(host="127.0.0.1", port=9)
+    monkeypatch.setenv("BUSY_BRIDGE_ACCESS_LOG", "1")
+    server.start_server(host="127.0.0.1", port=9)
+
+    assert runs == [
+        {"host": "127.0.0.1", "port": 9, "access_log": False},
+        {"host": "127.0.0.1", "port": 9, "access_log": True},
+    ]
+
+
+def test_encode_json_matches_fastapi_encoding():
+    import json
+    from datetime import datetime
+    from enum import Enum
+    from pathlib import PurePosixPath
+
+    from fastapi.encoders import jsonable_encoder
+
+    class State(Enum):
+        RUNNING = "running"
+
+    payloads = [
+        {"mission_id": "m1", "steps": [{"status": "done", "output": None}], "n": 1.5},
+        {"state": State.RUNNING, "at": datetime(2026, 1, 1, 12, 0, 0), "path": PurePosixPath("/a")},
+        {"big": 2**70},
+    ]
+    for payload in payloads:
+        assert json.loads(server._encode_json(payload)) == jsonable_encoder(payload)
+
+
+def test_mission_detail_route_returns_encoded_json(fake_adapter, client):
+    async def get_mission(mission_id):
+        if mission_id != "m1":
+            raise ValueError(f"Mission not found: {mission_id}")
+        return {"mission_id": "m1", "state": "running"}
+
+    fake_adapter.get_mission = get_mission
+    response = client.get("/missions/m1")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"mission_id": "m1", "state": "running"}
+    assert client.get("/missions/nope").status_code == 404
+
+
+def test_missions_limit_returns_a_page_and_its_cursor(fake_adapter, client):
+    fake_adapter.missions.append({"mission_id": "m2", "state": "pending"})
+    response = client.get("/missions", params={"since_version": 3, "limit": 1})
+    assert response.json() == {"missions": fake_adapter.missions[:1], "version": 4}
+    assert fake_adapter.calls[-1] == ("list_missions_page", 3, 1)
+    assert client.get("/missions", params={"limit": 0}).status_code == 422
+
+
+def test_mission_events_stream_changes_until_terminal(fake_adapter, client, monkeypatch):
+    import json
+
+    states = iter(["pending", "pending", "running", "approved"])
+
+    async def get_mission(mission_id):
+        if mission_id != "m1":
+            raise ValueError(f"Mission not found: {mission_id}")
+        return {"mission_id": "m1", "state": next(states)}
+
+    async def get_mission_notes(mission_id):
+        return []
+
+    fake_adapter.get_mission = get_mission
+    fake_adapter.get_mission_notes = get_mission_notes
+    monkeypatch.setattr(server, "_EVENT_POLL_INTERVAL", 0)
+
+    response = client.get("/missions/m1/events")
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = [f for f in response.text.split("\n\n") if f]
+    assert all(f.startswith("event: mission\ndata: ") for f in frames)
+    snapshots = [json.loads(f.split("data: ", 1)[1]) for f in frames]
+    # The repeated "pending" snapshot is not re-sent.
+    assert [s["mission"]["state"] for s in snapshots] == ["pending", "running", "approved"]
+    assert snapshots[0]["notes"] == []
+
+    assert client.get("/missions/nope/events").status_code == 404
+
+
+def test_large_mission_listings_are_gzipped(fake_adapter, client):
+    fake_adapter.missions = [
+        {"mission_id": f"m{i}", "state": "running", "objective": "poll me"} for i in range(40)
+    ]
+    listing = client.get("/missions", headers={"Accept-Encoding": "gzip"})
+    assert listing.headers["content-encoding"] == "gzip"
+    assert len(listing.json()["missions"]) == 40
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_mission_events_report_failures_as_an_error_event(fake_adapter, client, monkeypatch):
+    import json
+
+    seen = []
+
+    async def get_mission(mission_id):
+        if seen:
+            raise ValueError(f"Mission not found: {mission_id}")
+        seen.append(mission_id)
+        return {"mission_id": mission_id, "state": "running"}
+
+    async def get_mission_notes(mission_id):
+        return []
+
+    fake_adapter.get_mission = get_mission
+    fake_adapter.get_mission_notes = get_mission_notes
+    monkeypatch.setattr(server, "_EVENT_POLL_INTERVAL", 0)
+
+    frames = [f for f in client.get("/missions/m1/events").text.split("\n\n") if f]
+    assert frames[0].startswith("event: mission\n")
+    assert frames[-1].startswith("event: error\ndata: ")
+    assert json.loads(frames[-1].split("data: ", 1)[1]) == {"detail": "Mission not found: m1"}
+
+    async def broken_notes(mission_id):
+        raise RuntimeError("notes store offline")
+
+    seen.clear()
+    fake_adapter.get_mission_notes = broken_notes
+    frames = [f for f in client.get("/missions/m1/events").text.split("\n\n") if f]
+    assert frames == ['event: error\ndata: {"detail":"notes store offline"}']
+
+
+def test_mission_events_initial_lookup_failure_is_a_500(fake_adapter, client):
+    async def get_mission(mission_id):
+        raise RuntimeError("busy offline")
+
+    fake_adapter.get_mission = get_mission
+    response = client.get("/missions/m1/events")
+    assert response.status_code == 500
+    assert response.json() == {"detail": "busy offline"}
+    assert response.headers["content-type"].startswith("application/json")
+
+
+def test_gzip_never_touches_event_streams(monkeypatch):
+    import asyncio
+
+    sent = []
+
+    async def inner(scope, receive, send):
+        sent.append(scope["path"])
+
+    middleware = server._GZipExceptEventStreams(inner, minimum_size=1)
+    scope = {
+        "type": "http",
+        "path": "/missions/m1/events",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+
+    async def must_not_compress(self, scope, receive, send):
+        raise AssertionError("event streams must bypass GZipMiddleware")
+
+    monkeypatch.setattr(server.GZipMiddleware, "__call__", must_not_compress)
+    asyncio.run(middleware(scope, None, None))
+    assert sent == ["/missions/m1/events"]
+
+
+def test_full_listing_body_does_not_outlive_its_adapter(monkeypatch):
+    bodies = []
+    for mission_id in ("from-adapter-1", "from-adapter-2"):
+        fake = FakeAdapter()
+        fake.missions = [{"mission_id": mission_id}]
+        monkeypatch.setattr(adapter_mod, "_adapter", fake)
+        with TestClient(server.app) as client:
+            bodies.append(client.get("/missions").json()["missions"])
+    assert bodies == [[{"mission_id": "from-adapter-1"}], [{"mission_id": "from-adapter-2"}]]